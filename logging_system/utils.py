@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 import logging
 import os
 
+from functools import lru_cache
+
 from ..ansi_colors import colorize
 from ..ansi_colors import console_supports_color
 from ..misc_utils import get_system_tempdir
@@ -22,6 +24,25 @@ from ..misc_utils import get_system_tempdir
 from . import log_levels
 
 
+@lru_cache(maxsize=None)
+def _get_formatter(fmt: str) -> logging.Formatter:
+    """Get a formatter for the specified format string.
+
+    Formatters are cached so they aren't re-created for every logged record.
+
+    Parameters
+    ----------
+    fmt : str
+        Format string.
+
+    Returns
+    -------
+    logging.Formatter
+        A formatter.
+    """
+    return logging.Formatter(fmt)
+
+
 class NoFileFilter(logging.Filter):
     """Filter file handler records."""
 
@@ -224,6 +245,9 @@ class FileHandlerFormatter(logging.Formatter):
         self._format_str: str = options.get("format_str", self.default_format_str)
         self._obfuscate_user_home: bool = options.get("obfuscate_user_home", True)
         self._user_home: str = os.path.expanduser("~")
+        self._message_only_formatter: logging.Formatter = _get_formatter(
+            self.message_only_format_str
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record.
@@ -238,13 +262,13 @@ class FileHandlerFormatter(logging.Formatter):
         str
             The formatted message.
         """
-        fmt: str = getattr(record, "file_fmt", None) or self._format_str
-
-        if getattr(record, "message_only", False):
-            fmt = self.message_only_format_str
+        record_dict: dict[str, Any] = record.__dict__
 
-        formatter: logging.Formatter = logging.Formatter(fmt)
-        message: str = formatter.format(record)
+        if record_dict.get("message_only"):
+            message: str = self._message_only_formatter.format(record)
+        else:
+            fmt: str = record_dict.get("file_fmt") or self._format_str
+            message: str = _get_formatter(fmt).format(record)
 
         if self._obfuscate_user_home:
             message: str = message.replace(self._user_home, "~")
@@ -277,6 +301,9 @@ class StreamHandlerFormatter(logging.Formatter):
         self._format_str: str = options.get("format_str", self.default_format_str)
         self._obfuscate_user_home: bool = options.get("obfuscate_user_home", True)
         self._user_home: str = os.path.expanduser("~")
+        self._message_only_formatter: logging.Formatter = _get_formatter(
+            self.message_only_format_str
+        )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record.
@@ -291,13 +318,13 @@ class StreamHandlerFormatter(logging.Formatter):
         str
             The formatted message.
         """
-        fmt: str = getattr(record, "stream_fmt", None) or self._format_str
+        record_dict: dict[str, Any] = record.__dict__
 
-        if getattr(record, "message_only", False):
-            fmt = self.message_only_format_str
-
-        formatter: logging.Formatter = logging.Formatter(fmt)
-        message: str = formatter.format(record)
+        if record_dict.get("message_only"):
+            message: str = self._message_only_formatter.format(record)
+        else:
+            fmt: str = record_dict.get("stream_fmt") or self._format_str
+            message: str = _get_formatter(fmt).format(record)
 
         if self._obfuscate_user_home:
             message: str = message.replace(self._user_home, "~")
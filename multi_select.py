@@ -18,8 +18,6 @@ class MultiSelect:
     ----------
     aborted : bool
         Menu selection aborted.
-    all_menu_items : list[dict]
-        The menu items that constitute the multi select menu.
     arrow : str
         The character/s used to *point* the menu item that can be selected.
     char_empty : str
@@ -30,16 +28,23 @@ class MultiSelect:
         The current cursor position.
     footer : str
         Informational text placed at the bottom of the menu.
+    labels : list[str]
+        The labels of the menu items that constitute the multi select menu.
     length : int
         The amount of menu items.
     more : str
         Character/s representing the availability of more menu items than the screen can display.
     offset : int
         Te amount of menu items off-screen. (?)
+    pad : curses.window | None
+        A pad containing all menu items.
     selcount : int
         The amount of selected menu items.
     selected : int
         The index of the menu item on the current cursor position.
+    selected_mask : bytearray
+        The selected state of each menu item (``1`` if selected, ``0`` if not). Stored in
+        parallel with :py:attr:`labels`.
     stdscr : curses.window | None
         Initialize the library.
     title : str
@@ -110,41 +115,55 @@ class MultiSelect:
         self.char_selected: str = char_selected
         self.char_empty: str = char_empty
 
-        self.all_menu_items: list[dict] = []
+        self.labels: list[str] = list(menu_items)
+        self.selected_mask: bytearray = bytearray(len(self.labels))
         self.win: curses.window | None = None
+        self.pad: curses.window | None = None
         self.stdscr: curses.window | None = None
         self.cursor: int = 0
         self.offset: int = 0
         self.selected: int = 0
         self.selcount: int = 0
         self.aborted: bool = False
-        self.window_height: int = (get_terminal_size((80, 24))[1] or 24) - 5
-        self.window_width: int = get_terminal_size((80, 24))[0] or 80
-        self.length: int = 0
-
-        for item in menu_items:
-            self.all_menu_items.append({"label": item, "selected": False})
-            self.length = len(self.all_menu_items)
-
-        self.curses_start()
+        term_cols, term_rows = get_terminal_size((80, 24))
+        self.window_height: int = (term_rows or 24) - 5
+        self.window_width: int = term_cols or 80
+        self._pad_width: int = self.window_width - 6
+        # NOTE: Pads and truncates a row to the pad width in one go.
+        self._row_fmt: str = "{:<%d.%d}" % (self._pad_width, self._pad_width)
+        self.length: int = len(self.labels)
+        self._prev_cursor: int = 0
+        self._prev_offset: int = 0
+        self._prev_counter: str = ""
+        self._title_str: str = f" {title} "
+        self._footer_str: str = f" {footer} "
+        self._sel_prefix: str = char_selected + " "
+        self._empty_prefix: str = char_empty + " "
+
+        # NOTE: curses.wrapper takes care of initializing and restoring the terminal.
         curses.wrapper(self.curses_loop)
-        self.curses_stop()
 
-    def curses_start(self) -> None:
-        """curses start."""
-        self.stdscr = curses.initscr()
+    def curses_start(self, stdscr: curses.window) -> None:
+        """curses start.
 
-        curses.noecho()
-        curses.cbreak()
+        Parameters
+        ----------
+        stdscr : curses.window
+            The window object provided by :py:func:`curses.wrapper`.
+        """
+        self.stdscr = stdscr
+        stdscr.keypad(True)
         curses.curs_set(0)
+        # NOTE: Flush the initial clearing of stdscr. Otherwise, it would be performed by the
+        # first stdscr.getch() call, wiping out what was drawn into the other windows.
+        stdscr.noutrefresh()
         self.win = curses.newwin(5 + self.window_height, self.window_width, 0, 0)
+        # NOTE: The pad holds all menu items. One extra line so writing a full width line
+        # on the last menu item doesn't move the cursor out of the pad.
+        self.pad = curses.newpad(max(self.length, self.window_height + 1) + 1, self._pad_width)
 
-    def curses_stop(self) -> None:
-        """curses stop."""
-        curses.nocbreak()
-        self.stdscr.keypad(False)
-        curses.echo()
-        curses.endwin()
+        for index in range(self.length):
+            self._draw_pad_row(index)
 
     def getSelected(self) -> list[str]:
         """Get selected.
@@ -157,45 +176,92 @@ class MultiSelect:
         if self.aborted:
             return []
 
-        selected_items: list[dict] = [x for x in self.all_menu_items if x["selected"]]
-        selected_items_labels: list[str] = [x["label"] for x in selected_items]
-        return selected_items_labels
+        return [label for label, selected in zip(self.labels, self.selected_mask) if selected]
 
     def redraw(self) -> None:
-        """Redraw."""
-        self.win.clear()
-        self.win.box(0, 0)
-        self.win.addstr(self.window_height + 4, 5, " " + self.footer + " ", curses.A_BOLD)
+        """Redraw.
 
-        position = 0
-        items_range = self.all_menu_items[self.offset: self.offset + self.window_height + 1]
+        Only the parts of the window that changed since the last draw are re-drawn. The menu
+        items are drawn into a pad, so scrolling them only changes the region of the pad that
+        is displayed.
+        """
+        counter: str = f" {self.selcount}/{self.length} "
 
-        for option in items_range:
-            if option["selected"]:
-                line_label = self.char_selected + " "
-            else:
-                line_label = self.char_empty + " "
+        if not self._prev_counter or len(counter) != len(self._prev_counter):
+            self._draw_full(counter)
+        else:
+            self._draw_incremental(counter)
+
+        self._prev_cursor = self.cursor
+        self._prev_offset = self.offset
+        self._prev_counter = counter
+        # NOTE: Only update the virtual screen. The physical screen is updated once per loop
+        # iteration with curses.doupdate().
+        self.win.noutrefresh()
+        self.pad.noutrefresh(
+            self.offset, 0, 2, 5, self.window_height + 2, 5 + self._pad_width - 1
+        )
 
-            self.win.addstr(position + 2, 5, line_label + option["label"])
-            position = position + 1
+    def _draw_pad_row(self, index: int) -> None:
+        """Draw a menu item into the pad.
+
+        Parameters
+        ----------
+        index : int
+            The index of the menu item to draw.
+        """
+        prefix: str = self._sel_prefix if self.selected_mask[index] else self._empty_prefix
+        self.pad.addstr(index, 0, self._row_fmt.format(prefix + self.labels[index]))
+
+    def _draw_more_hints(self) -> None:
+        """Draw the hints for more content above and below the visible menu items."""
+        blank: str = " " * len(self.more)
 
         # hint for more content above
-        if self.offset > 0:
-            self.win.addstr(1, 5, self.more)
+        self.win.addstr(1, 5, self.more if self.offset > 0 else blank)
 
         # hint for more content below
-        if self.offset + self.window_height <= self.length - 2:
-            self.win.addstr(self.window_height + 3, 5, self.more)
-
-        self.win.addstr(0, 5, " " + self.title + " ", curses.A_BOLD)
         self.win.addstr(
-            0,
-            self.window_width - 8,
-            " " + str(self.selcount) + "/" + str(self.length) + " ",
-            curses.A_BOLD,
+            self.window_height + 3,
+            5,
+            self.more if self.offset + self.window_height <= self.length - 2 else blank,
         )
+
+    def _draw_full(self, counter: str) -> None:
+        """Clear the window and draw all of its content.
+
+        Parameters
+        ----------
+        counter : str
+            The selected items counter.
+        """
+        self.win.clear()
+        self.win.box(0, 0)
+        self.win.addstr(self.window_height + 4, 5, self._footer_str, curses.A_BOLD)
+        self._draw_more_hints()
+        self.win.addstr(0, 5, self._title_str, curses.A_BOLD)
+        self.win.addstr(0, self.window_width - 8, counter, curses.A_BOLD)
         self.win.addstr(self.cursor + 2, 1, self.arrow, curses.A_BOLD)
-        self.win.refresh()
+        # NOTE: Make sure that the pad is copied again over the cleared window.
+        self.pad.touchwin()
+
+    def _draw_incremental(self, counter: str) -> None:
+        """Draw only the counter, arrow and hints that changed since the last draw.
+
+        Parameters
+        ----------
+        counter : str
+            The selected items counter.
+        """
+        if counter != self._prev_counter:
+            self.win.addstr(0, self.window_width - 8, counter, curses.A_BOLD)
+
+        if self.cursor != self._prev_cursor:
+            self.win.addstr(self._prev_cursor + 2, 1, " " * len(self.arrow))
+            self.win.addstr(self.cursor + 2, 1, self.arrow, curses.A_BOLD)
+
+        if self.offset != self._prev_offset:
+            self._draw_more_hints()
 
     def check_cursor_up(self) -> None:
         """Check cursor up."""
@@ -216,9 +282,48 @@ class MultiSelect:
             if self.offset + self.cursor >= self.length:
                 self.offset = self.offset - 1
 
+    def handle_key(self, c: int) -> bool:
+        """Handle a key press.
+
+        Parameters
+        ----------
+        c : int
+            The pressed key code.
+
+        Returns
+        -------
+        bool
+            Whether the menu should be closed.
+        """
+        if c == ord("q") or c == ord("Q"):
+            self.aborted = True
+            return True
+        elif c == curses.KEY_UP:
+            self.cursor = self.cursor - 1
+        elif c == curses.KEY_DOWN:
+            self.cursor = self.cursor + 1
+        elif c == ord(" "):
+            self.selected_mask[self.selected] ^= 1
+            self.selcount += 1 if self.selected_mask[self.selected] else -1
+            self._draw_pad_row(self.selected)
+        elif c == 10:
+            return True
+
+        # deal with interaction limits
+        self.check_cursor_up()
+        self.check_cursor_down()
+
+        # compute selected position only after dealing with limits
+        self.selected = self.cursor + self.offset
+
+        return False
+
     def curses_loop(self, stdscr) -> None:
         """Curses loop.
 
+        All pending key presses are handled before redrawing the window. This way, holding a key
+        only redraws the window once per batch of key presses.
+
         Parameters
         ----------
         stdscr : object
@@ -229,34 +334,26 @@ class MultiSelect:
         exceptions.KeyboardInterruption
             Halt execution on Ctrl + C press.
         """
+        self.curses_start(stdscr)
+
         try:
-            while True:
+            done: bool = False
+
+            while not done:
                 self.redraw()
+                curses.doupdate()
                 c = stdscr.getch()
+                stdscr.nodelay(True)
+
+                while c != -1:
+                    done = self.handle_key(c)
+
+                    if done:
+                        break
+
+                    c = stdscr.getch()
 
-                if c == ord("q") or c == ord("Q"):
-                    self.aborted = True
-                    break
-                elif c == curses.KEY_UP:
-                    self.cursor = self.cursor - 1
-                elif c == curses.KEY_DOWN:
-                    self.cursor = self.cursor + 1
-                elif c == ord(" "):
-                    self.all_menu_items[self.selected]["selected"] = not self.all_menu_items[
-                        self.selected
-                    ]["selected"]
-                elif c == 10:
-                    break
-
-                # deal with interaction limits
-                self.check_cursor_up()
-                self.check_cursor_down()
-
-                # compute selected position only after dealing with limits
-                self.selected = self.cursor + self.offset
-
-                temp = self.getSelected()
-                self.selcount = len(temp)
+                stdscr.nodelay(False)
         except (KeyboardInterrupt, SystemExit):
             self.aborted = True
             raise exceptions.KeyboardInterruption()
@@ -9,8 +9,6 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 import sys
-import termios
-import tty
 
 from . import exceptions
 from .ansi_colors import colorize
@@ -69,16 +67,19 @@ def confirm(prompt: str | None = None, response: bool = False) -> bool:
     else:
         prompt = "**%s [%s/%s]:** " % (prompt, "N", "y")
 
+    colored_prompt: str = colorize(prompt)
+    colored_warning: str = colorize("**Please enter y or n.**", "warning")
+
     try:
         while True:
             # Lower the input case just so I don't have to micro-manage the answer.
-            ans: str = input(colorize(prompt)).lower()
+            ans: str = input(colored_prompt).lower()
 
             if not ans:
                 return response
 
             if ans not in ["y", "n"]:
-                print(colorize("**Please enter y or n.**", "warning"))
+                print(colored_warning)
                 continue
 
             if ans == "y":
@@ -167,24 +168,8 @@ def term_decode(text: str) -> str:
     **Modifications**:
 
     - Eradicated Python 2 specific code.
+    - Removed the decoding fallback. Input read with :py:func:`input` is always a string.
     """
-    if isinstance(text, str):
-        return text
-
-    print(
-        colorize(
-            "* Note: non-ASCII characters entered "
-            "and terminal encoding unknown -- assuming "
-            "UTF-8 or Latin-1.",
-            "warning",
-        )
-    )
-
-    try:
-        text = text.decode("utf-8")
-    except UnicodeDecodeError:
-        text = text.decode("latin1")
-
     return text
 
 
@@ -267,6 +252,10 @@ def read_char(txt: str) -> str:
     str
         The read character.
     """
+    # NOTE: Imported here so this module can be imported on non-POSIX systems.
+    import termios
+    import tty
+
     print(colorize(txt))
     fd: int = sys.stdin.fileno()
     old_settings: list = termios.tcgetattr(fd)
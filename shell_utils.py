@@ -23,20 +23,14 @@ def get_cli_header(name: str, char: str = "#") -> str:
         The actual "header".
     """
     term_length: int = get_terminal_size((80, 24))[0] or 80
-    sep: str = get_cli_separator(char)
+    sep: str = _get_separator(char, term_length)
     sub_sep: str = "%s" % (int((term_length - (len(name) + 2)) / 2) * char)
-    mid: str = "%s %s %s" % (sub_sep, name, sub_sep)
-
-    while True:
-        if len(mid) < term_length:
-            mid += char
-            continue
-
-        if len(mid) >= term_length:
-            break
+    core: str = "%s %s %s" % (sub_sep, name, sub_sep)
+    pad: int = max(0, term_length - len(core))
+    mid: str = (core + char * pad)[:term_length]
 
     header: str = sep + "\n"
-    header += mid[:term_length] + "\n"
+    header += mid + "\n"
     header += sep
 
     return header
@@ -57,7 +51,24 @@ def get_cli_separator(char: str = "#") -> str:
     str
         The actual "separator".
     """
-    term_length: int = get_terminal_size((80, 24))[0] or 80
+    return _get_separator(char, get_terminal_size((80, 24))[0] or 80)
+
+
+def _get_separator(char: str, term_length: int) -> str:
+    """Get a "decorated separator" of a given length.
+
+    Parameters
+    ----------
+    char : str
+        The "decorator" character.
+    term_length : int
+        The terminal width.
+
+    Returns
+    -------
+    str
+        The actual "separator".
+    """
     return "%s" % (term_length * char)
 
 
@@ -16,7 +16,8 @@ from . import exceptions
 from . import file_utils
 
 
-_hostname_regex: re.Pattern = re.compile(r"(?!-)[\w-]{1,63}(?<!-)$")
+_hostname_regex: re.Pattern = re.compile(r"(?!-)[\w-]{1,63}(?<!-)")
+_user_home: str = file_utils.expand_path("~")
 
 
 def is_valid_host(host: str) -> bool:
@@ -38,10 +39,12 @@ def is_valid_host(host: str) -> bool:
     <https://stackoverflow.com/questions/2532053/validate-a-hostname-string>`__
     """
     host = host.rstrip(".")
+    host_length: int = len(host)
 
-    return all(
-        [len(host) > 1, len(host) < 253] + [bool(_hostname_regex.match(x)) for x in host.split(".")]
-    )
+    if host_length <= 1 or host_length >= 253:
+        return False
+
+    return all(_hostname_regex.fullmatch(x) for x in host.split("."))
 
 
 def is_valid_ip(address: str) -> bool:
@@ -78,7 +81,14 @@ def is_valid_integer(integer: str | int) -> bool:
     bool
         If the value is a valid integer or not.
     """
-    return str(integer).isdigit()
+    # NOTE: bool is a subclass of int, but str(True) was never a valid integer.
+    if isinstance(integer, bool):
+        return False
+
+    if isinstance(integer, int):
+        return integer >= 0
+
+    return isinstance(integer, str) and integer.isdigit()
 
 
 def validate_output_path(x: str) -> str:
@@ -101,7 +111,7 @@ def validate_output_path(x: str) -> str:
     exceptions.ValidationError
         Halt execution if option is not valid.
     """
-    if x == file_utils.expand_path("~") or x == "~":
+    if x == _user_home or x == "~":
         raise exceptions.ValidationError("Seriously, don't be daft! Choose another location!")
     elif x == "/":
         raise exceptions.ValidationError(
@@ -136,6 +146,7 @@ def generate_numeral_options_validator(
         Description
     """
     options_list = [str(n + 1) if stringify else n + 1 for n in list(range(num))]
+    options_set = frozenset(options_list)
 
     def validate_options(x: str | int) -> str | int:
         """Validate numeral options.
@@ -155,7 +166,7 @@ def generate_numeral_options_validator(
         exceptions.ValidationError
             Halt execution if option is not valid.
         """
-        if not x or x not in options_list:
+        if not x or x not in options_set:
             raise exceptions.ValidationError("Possible options are: %s" % ", ".join(options_list))
 
         return x
@@ -6,13 +6,27 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from email.message import Message
+
     from .logging_system import Logger
 
+import io
+import json
 import os
-
+import zlib
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from functools import lru_cache
 from runpy import run_path
 from shutil import rmtree
 from sphinx.cmd.build import main as sphinx_main
+from urllib.request import Request
+from urllib.request import urlopen
 
 from . import exceptions
 from . import file_utils
@@ -20,8 +34,222 @@ from . import tqdm_wget
 from .misc_utils import get_system_tempdir
 
 
+def _run_sphinx(argv: list[str]) -> tuple[int, str]:
+    """Run a Sphinx build.
+
+    Module level function so it can be pickled and sent to a worker process.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments to pass to Sphinx.
+
+    Returns
+    -------
+    tuple[int, str]
+        The Sphinx build exit status and its output.
+    """
+    # NOTE: Builds run concurrently. Their output is captured so it can be printed along with
+    # the build it belongs to instead of interleaved with the output of other builds.
+    output: io.StringIO = io.StringIO()
+
+    with redirect_stdout(output), redirect_stderr(output):
+        status: int = sphinx_main(argv=argv)
+
+    return status, output.getvalue()
+
+
+def _run_apidoc(argv: list[str]) -> int:
+    """Run sphinx-apidoc.
+
+    Module level function so it can be pickled and sent to a worker process.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments to pass to sphinx-apidoc.
+
+    Returns
+    -------
+    int
+        The sphinx-apidoc exit status.
+    """
+    from sphinx.ext.apidoc import main as apidoc_main
+
+    return apidoc_main(argv=argv)
+
+
+def _get_sphinx_jobs_args(sphinx_jobs: str | int | None = None) -> list[str]:
+    """Get the arguments that control Sphinx parallel builds.
+
+    Parameters
+    ----------
+    sphinx_jobs : str | int | None, optional
+        Number of processes used by Sphinx. If not specified, the ``SPHINXJOBS`` environment
+        variable is used.
+
+    Returns
+    -------
+    list[str]
+        Arguments to pass to Sphinx. Empty if the number of processes wasn't set, so Sphinx
+        uses its default.
+    """
+    if sphinx_jobs is None:
+        sphinx_jobs = os.environ.get("SPHINXJOBS")
+
+    # NOTE: Only parallelize when explicitly asked to. Several Sphinx builds can run at the same
+    # time and ``-j auto`` in each one of them would start far more processes than CPUs.
+    if sphinx_jobs is None or sphinx_jobs == "":
+        return []
+
+    return ["-j", str(sphinx_jobs)]
+
+
+def _get_doctree_location(
+    root_folder: str, docs_sources_path: str, doctree_temp_location_rel_to_sys_temp: str
+) -> str:
+    """Get the base doctrees location.
+
+    Parameters
+    ----------
+    root_folder : str
+        Path to the main folder that most paths should be relative to.
+    docs_sources_path : str
+        Path to the documentation source files.
+    doctree_temp_location_rel_to_sys_temp : str
+        Name of a temporary folder relative to the system temporary folder.
+
+    Returns
+    -------
+    str
+        Path to the base doctrees location. It's always the same for the same documentation
+        sources so the doctrees can be reused between builds.
+    """
+    cache_dir: str = os.environ.get("SPHINXCACHE", "")
+
+    if not cache_dir and doctree_temp_location_rel_to_sys_temp:
+        return os.path.join(get_system_tempdir(), doctree_temp_location_rel_to_sys_temp)
+
+    if not cache_dir:
+        cache_dir = os.path.join(root_folder, ".sphinx-cache")
+
+    # NOTE: Only used to tell apart the caches of different documentation sources. A non
+    # cryptographic checksum is enough and is available on FIPS enabled Python builds.
+    sources_hash: str = "%08x" % zlib.crc32(os.path.abspath(docs_sources_path).encode("utf-8"))
+
+    return os.path.join(cache_dir, "doctrees-%s" % sources_hash)
+
+
+def _get_builder_doctree_location(doctree_temp_location: str, builder: str) -> str:
+    """Get the doctrees location for a specific builder.
+
+    Parameters
+    ----------
+    doctree_temp_location : str
+        Base doctrees location.
+    builder : str
+        Sphinx builder name.
+
+    Returns
+    -------
+    str
+        Path to the doctrees directory used by the builder.
+    """
+    return "%s-%s" % (os.path.normpath(doctree_temp_location), builder)
+
+
+@lru_cache(maxsize=16)
+def _load_intersphinx_mapping(mapping_file_path: str, mtime_ns: int) -> dict[str, tuple[str, str]]:
+    """Load the intersphinx mapping from a file.
+
+    The result is cached so the file is only executed again when it is modified.
+
+    Parameters
+    ----------
+    mapping_file_path : str
+        Path to the ``intersphinx_mapping.py`` file.
+    mtime_ns : int
+        The file modification time. Only used as part of the cache key.
+
+    Returns
+    -------
+    dict[str, tuple[str, str]]
+        The intersphinx mapping.
+    """
+    return run_path(mapping_file_path)["intersphinx_mapping"]
+
+
+def _request_headers(url: str) -> Message:
+    """Request the headers of a URL.
+
+    Parameters
+    ----------
+    url : str
+        The URL to request.
+
+    Returns
+    -------
+    Message
+        The response headers.
+    """
+    with urlopen(Request(url, method="HEAD")) as response:
+        return response.headers
+
+
+def _get_inventory_meta(headers: Message) -> dict[str, str]:
+    """Get the headers used to check if an inventory file was modified.
+
+    Parameters
+    ----------
+    headers : Message
+        Response headers.
+
+    Returns
+    -------
+    dict[str, str]
+        The ``ETag`` and ``Last-Modified`` headers. Only the ones that were found.
+    """
+    return {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+
+
+def _read_inventory_meta(inv_path: str) -> dict[str, str]:
+    """Read the headers stored when an inventory file was downloaded.
+
+    Parameters
+    ----------
+    inv_path : str
+        Path to the inventory file.
+
+    Returns
+    -------
+    dict[str, str]
+        The stored headers. An empty dictionary if they couldn't be read.
+    """
+    try:
+        with open(inv_path + ".meta.json", "r", encoding="UTF-8") as meta_file:
+            return json.load(meta_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_inventory_meta(inv_path: str, meta: dict[str, str]) -> None:
+    """Store the headers of a downloaded inventory file.
+
+    Parameters
+    ----------
+    inv_path : str
+        Path to the inventory file.
+    meta : dict[str, str]
+        The headers to store.
+    """
+    with open(inv_path + ".meta.json", "w", encoding="UTF-8") as meta_file:
+        json.dump(meta, meta_file)
+
+
 def check_inventories_existence(
-    update_inventories: bool = False, docs_sources_path: str = "", logger: Logger | None = None
+    update_inventories: bool | str = False,
+    docs_sources_path: str = "",
+    logger: Logger | None = None,
 ):
     """Check inventories existence. Download them if they don't exist.
 
@@ -31,9 +259,11 @@ def check_inventories_existence(
 
     Parameters
     ----------
-    update_inventories : bool, optional
-        Whether to force the update of the inventory files. Inventory files will be updated
-        anyway f they don't exist.
+    update_inventories : bool | str, optional
+        Whether to update the inventory files. If ``True``, inventory files are only downloaded
+        if the remote files were modified (based on their ``ETag`` and ``Last-Modified``
+        headers). If ``"force"``, inventory files are always downloaded. Inventory files will
+        be downloaded anyway if they don't exist.
     docs_sources_path : str, optional
         Path to the documentation source files that will be used to store the
         downloaded inventories.
@@ -50,33 +280,89 @@ def check_inventories_existence(
     mapping_file_path: str = os.path.join(docs_sources_path, "intersphinx_mapping.py")
 
     if file_utils.is_real_file(mapping_file_path):
-        intersphinx_mapping: dict[str, tuple[str, str]] = run_path(mapping_file_path)[
-            "intersphinx_mapping"
-        ]
+        intersphinx_mapping: dict[str, tuple[str, str]] = _load_intersphinx_mapping(
+            mapping_file_path, os.stat(mapping_file_path).st_mtime_ns
+        )
 
         logger.info("**Checking existence of inventory files...**")
+        # NOTE: Tuples of inventory URL, inventory path and whether the remote inventory should
+        # be checked for modifications before downloading it.
+        pending_downloads: list[tuple[str, str, bool]] = []
 
         for url, inv in intersphinx_mapping.values():
             inv_url: str = url + "/objects.inv"
             inv_path: str = os.path.join(docs_sources_path, inv)
 
-            if update_inventories or not os.path.exists(inv_path):
+            if update_inventories == "force" or not os.path.exists(inv_path):
                 os.makedirs(os.path.dirname(inv_path), exist_ok=True)
-                logger.info("**Downloading inventory file...**")
+                logger.info("**Inventory file will be downloaded:**")
                 logger.info("**Download URL:**")
                 logger.info(inv_url)
                 logger.info("**Download location:**")
                 logger.info(inv_path)
+                pending_downloads.append((inv_url, inv_path, False))
+            elif update_inventories:
+                logger.info("**Inventory file will be updated if modified:**")
+                logger.info(inv_path)
+                pending_downloads.append((inv_url, inv_path, True))
+            else:
+                logger.info("**Inventory file exists:**")
+                logger.info(inv_path)
+
+        if pending_downloads:
+            logger.info("**Downloading inventory files...**")
+
+            def download_inventory(inventory: tuple[str, str, bool]) -> None:
+                """Download inventory file.
+
+                Parameters
+                ----------
+                inventory : tuple[str, str, bool]
+                    The inventory URL, the path to where to store it and whether to skip the
+                    download if the remote inventory wasn't modified.
+                """
+                inv_url, inv_path, check_modified = inventory
+
+                if check_modified:
+                    # NOTE: The inventory is downloaded anyway if its headers can't be checked
+                    # (e.g. servers rejecting HEAD requests). It's only skipped if the headers
+                    # positively match the ones stored when it was downloaded.
+                    try:
+                        remote_meta: dict[str, str] = _get_inventory_meta(
+                            _request_headers(inv_url)
+                        )
+                    except Exception as err:
+                        logger.warning(err)
+                        remote_meta = {}
+
+                    if remote_meta and remote_meta == _read_inventory_meta(inv_path):
+                        logger.info("**Inventory file is up to date:**")
+                        logger.info(inv_path)
+                        return
 
                 try:
-                    tqdm_wget.download(inv_url, inv_path)
-                except (KeyboardInterrupt, SystemExit):
-                    raise exceptions.KeyboardInterruption()
+                    _write_inventory_meta(
+                        inv_path, _get_inventory_meta(tqdm_wget.download(inv_url, inv_path))
+                    )
                 except Exception as err:
                     logger.exception(err)
-            else:
-                logger.info("**Inventory file exists:**")
-                logger.info(inv_path)
+
+            with ThreadPoolExecutor(max_workers=min(8, len(pending_downloads))) as executor:
+                futures: list[Future] = [
+                    executor.submit(download_inventory, inventory)
+                    for inventory in pending_downloads
+                ]
+
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except (KeyboardInterrupt, SystemExit):
+                    # NOTE: Do not start downloads that are still queued. Running downloads
+                    # will be waited for when leaving the executor context.
+                    for future in futures:
+                        future.cancel()
+
+                    raise exceptions.KeyboardInterruption()
 
 
 def generate_docs(
@@ -88,12 +374,15 @@ def generate_docs(
     ignored_modules: list[str] = [],
     generate_html: bool = True,
     generate_api_docs: bool = False,
-    update_inventories: bool = False,
+    update_inventories: bool | str = False,
     force_clean_build: bool = False,
     build_coverage: bool = True,
     build_doctest: bool = False,
     logger: Logger | None = None,
-):
+    *,
+    clean_doctree_cache: bool = False,
+    sphinx_jobs: str | int | None = None,
+) -> int:
     """Build this application documentation.
 
     Parameters
@@ -110,7 +399,9 @@ def generate_docs(
         the generated rst files at index one.
     doctree_temp_location_rel_to_sys_temp : str, optional
         Name of a temporary folder that will be used to create a path relative to the
-        system temporary folder.
+        system temporary folder. If not specified, the doctrees are stored inside a
+        ``.sphinx-cache`` folder inside root_folder. The ``SPHINXCACHE`` environment variable,
+        if set, overrides both locations.
     ignored_modules : list[str], optional
         A list of paths to Python modules relative to the root_folder. These are ignored
         modules whose docstrings are a mess and/or are incomplete. Because such docstrings
@@ -119,9 +410,8 @@ def generate_docs(
         Generate HTML.
     generate_api_docs : bool, optional
         If False, do not extract docstrings from Python modules.
-    update_inventories : bool, optional
-        Whether to force the update of the inventory files. Inventory files will be updated
-        anyway f they don't exist.
+    update_inventories : bool | str, optional
+        Whether to update the inventory files. See :py:func:`check_inventories_existence`.
     force_clean_build : bool, optional
         Remove destination and doctrees directories before building the documentation.
     build_coverage : bool, optional
@@ -130,12 +420,30 @@ def generate_docs(
         If True, build Sphinx coverage documents.
     logger : Logger | None, optional
         The logger.
+    clean_doctree_cache : bool, optional
+        Remove the doctrees directories before building the documentation without removing the
+        destination directories. Doctrees are kept between builds by default so only modified
+        documents are parsed again.
+    sphinx_jobs : str | int | None, optional
+        Number of processes used by each Sphinx build (Sphinx's ``-j`` option). If not
+        specified, the ``SPHINXJOBS`` environment variable is used. If neither is set, Sphinx
+        builds aren't parallelized. The coverage, doctest and HTML builds run at the same time,
+        so each one of them uses this number of processes.
+
+    Returns
+    -------
+    int
+        The first non-zero exit status returned by the Sphinx builds or zero if all of them
+        succeeded.
     """
-    doctree_temp_location: str = os.path.join(
-        get_system_tempdir(), doctree_temp_location_rel_to_sys_temp
-    )
     docs_sources_path: str = os.path.join(root_folder, docs_src_path_rel_to_root)
+    doctree_temp_location: str = _get_doctree_location(
+        root_folder, docs_sources_path, doctree_temp_location_rel_to_sys_temp
+    )
     docs_destination_path: str = os.path.join(root_folder, docs_dest_path_rel_to_root)
+    # NOTE: Prefixes used to build paths by concatenation.
+    root_folder_sep: str = os.path.join(root_folder, "")
+    docs_sources_path_sep: str = os.path.join(docs_sources_path, "")
 
     check_inventories_existence(update_inventories, docs_sources_path, logger)
 
@@ -145,12 +453,12 @@ def generate_docs(
 
         # NOTE: Force to create ``.. auto*`` directives with only the :members: option set.
         # This way I can set all autodoc options in conf.py file > autodoc_default_options.
+        # NOTE: Set before starting the worker processes so they inherit it.
         os.environ["SPHINX_APIDOC_OPTIONS"] = "members"
-        from sphinx.ext.apidoc import main as apidoc_main
 
         # NOTE: Do not add more arguments to control ``.. auto*`` directives.
         # Set all autodoc options in conf.py file > autodoc_default_options.
-        commmon_args: list[str] = [
+        common_args: list[str] = [
             "--module-first",
             "--separate",
             "--private",
@@ -160,79 +468,130 @@ def generate_docs(
             "--output-dir",
         ]
 
+        # NOTE: ignored_modules are relative to root_folder, not to the current working directory.
+        ignored_modules_abs: list[str] = [
+            m if os.path.isabs(m) else root_folder_sep + m for m in ignored_modules
+        ]
+
+        apidoc_runs: list[list[str]] = []
+
         for rel_source_path, rel_destination_path in apidoc_paths_rel_to_root:
             apidoc_destination_path: str = os.path.join(root_folder, rel_destination_path)
 
             if force_clean_build:
                 rmtree(apidoc_destination_path, ignore_errors=True)
 
-            apidoc_main(
-                argv=commmon_args
+            apidoc_runs.append(
+                common_args
                 + [apidoc_destination_path, os.path.join(root_folder, rel_source_path)]
-                + ignored_modules
+                + ignored_modules_abs
             )
 
+        # NOTE: Each apidoc run handles a different package, so they can run concurrently.
+        # All of them must finish before building the documentation.
+        if apidoc_runs:
+            with ProcessPoolExecutor(max_workers=len(apidoc_runs)) as executor:
+                list(executor.map(_run_apidoc, apidoc_runs))
+
+    jobs_args: list[str] = _get_sphinx_jobs_args(sphinx_jobs)
+
+    # NOTE: The coverage, doctest and HTML builds are independent from each other. Each one
+    # gets its own doctrees directory so they can run concurrently without fighting over the
+    # pickled doctrees.
+    # NOTE: Tuples of the header logged along with the build output and the Sphinx arguments.
+    sphinx_builds: list[tuple[str, list[str]]] = []
+
     if build_coverage:
-        logger.sub_section()
-        logger.info("**Building coverage data...**")
+        coverage_doctree_location: str = _get_builder_doctree_location(
+            doctree_temp_location, "coverage"
+        )
 
-        if force_clean_build:
-            rmtree(doctree_temp_location, ignore_errors=True)
-
-        sphinx_main(
-            argv=[
-                docs_sources_path,
-                "-b",
-                "coverage",
-                "-d",
-                doctree_temp_location,
-                os.path.join(docs_sources_path, "coverage"),
-            ]
+        if force_clean_build or clean_doctree_cache:
+            rmtree(coverage_doctree_location, ignore_errors=True)
+
+        sphinx_builds.append(
+            (
+                "**Building coverage data...**",
+                [
+                    docs_sources_path,
+                    *jobs_args,
+                    "-b",
+                    "coverage",
+                    "-d",
+                    coverage_doctree_location,
+                    docs_sources_path_sep + "coverage",
+                ],
+            )
         )
 
     if build_doctest:
-        logger.sub_section()
-        logger.info("**Building doctest tests...**")
-
-        # NOTE: build_coverage already deleted and re-created temporary files.
-        # Do not delete them; make use of them.
-        if force_clean_build and not build_coverage:
-            rmtree(doctree_temp_location, ignore_errors=True)
-
-        sphinx_main(
-            argv=[
-                docs_sources_path,
-                "-b",
-                "doctest",
-                "-d",
-                doctree_temp_location,
-                os.path.join(docs_sources_path, "doctest"),
-            ]
+        doctest_doctree_location: str = _get_builder_doctree_location(
+            doctree_temp_location, "doctest"
+        )
+
+        if force_clean_build or clean_doctree_cache:
+            rmtree(doctest_doctree_location, ignore_errors=True)
+
+        sphinx_builds.append(
+            (
+                "**Building doctest tests...**",
+                [
+                    docs_sources_path,
+                    *jobs_args,
+                    "-b",
+                    "doctest",
+                    "-d",
+                    doctest_doctree_location,
+                    docs_sources_path_sep + "doctest",
+                ],
+            )
         )
 
     if generate_html:
-        logger.sub_section()
-        logger.info("**Generating HTML documentation...**")
+        html_doctree_location: str = _get_builder_doctree_location(doctree_temp_location, "html")
 
         if force_clean_build:
             rmtree(docs_destination_path, ignore_errors=True)
 
-            # NOTE: build_coverage or build_doctest already deleted and re-created temporary files.
-            # Do not delete them; make use of them.
-            if not build_coverage and not build_doctest:
-                rmtree(doctree_temp_location, ignore_errors=True)
-
-        sphinx_main(
-            argv=[
-                docs_sources_path,
-                "-b",
-                "html",
-                "-d",
-                doctree_temp_location,
-                docs_destination_path,
-            ]
+        if force_clean_build or clean_doctree_cache:
+            rmtree(html_doctree_location, ignore_errors=True)
+
+        sphinx_builds.append(
+            (
+                "**Generating HTML documentation...**",
+                [
+                    docs_sources_path,
+                    *jobs_args,
+                    "-b",
+                    "html",
+                    "-d",
+                    html_doctree_location,
+                    docs_destination_path,
+                ],
+            )
         )
 
+    return_code: int = 0
+
+    if sphinx_builds:
+        with ProcessPoolExecutor(max_workers=len(sphinx_builds)) as executor:
+            results: list[tuple[int, str]] = list(
+                executor.map(_run_sphinx, [argv for _, argv in sphinx_builds])
+            )
+
+        for (header, _), (result, output) in zip(sphinx_builds, results):
+            logger.sub_section()
+            logger.info(header)
+            print(output, end="")
+
+            if result:
+                logger.error("**Build failed with exit status %d**" % result)
+
+                if not return_code:
+                    return_code = result
+
+    return return_code
+
 
 def generate_man_pages(
     root_folder: str = "",
@@ -240,6 +599,8 @@ def generate_man_pages(
     docs_dest_path_rel_to_root: str = "",
     doctree_temp_location_rel_to_sys_temp: str = "",
     logger: Logger | None = None,
+    *,
+    sphinx_jobs: str | int | None = None,
 ):
     """Generate man pages.
 
@@ -253,25 +614,33 @@ def generate_man_pages(
         Built docs destination path relative to root_folder.
     doctree_temp_location_rel_to_sys_temp : str, optional
         Name of a temporary folder that will be used to create a path relative to the
-        system temporary folder.
+        system temporary folder. If not specified, the doctrees are stored inside a
+        ``.sphinx-cache`` folder inside root_folder. The ``SPHINXCACHE`` environment variable,
+        if set, overrides both locations.
     logger : Logger | None, optional
         The logger.
+    sphinx_jobs : str | int | None, optional
+        Number of processes used by Sphinx to build the documentation (Sphinx's ``-j`` option).
+        If not specified, the ``SPHINXJOBS`` environment variable is used. If neither is set,
+        the build isn't parallelized.
     """
     logger.sub_section()
     logger.info("**Generating manual pages...**")
-    doctree_temp_location: str = os.path.join(
-        get_system_tempdir(), doctree_temp_location_rel_to_sys_temp
-    )
     docs_sources_path: str = os.path.join(root_folder, docs_src_path_rel_to_root)
+    doctree_temp_location: str = _get_doctree_location(
+        root_folder, docs_sources_path, doctree_temp_location_rel_to_sys_temp
+    )
+    man_doctree_location: str = _get_builder_doctree_location(doctree_temp_location, "man")
     man_pages_destination_path: str = os.path.join(root_folder, docs_dest_path_rel_to_root)
 
     sphinx_main(
         argv=[
             docs_sources_path,
+            *_get_sphinx_jobs_args(sphinx_jobs),
             "-b",
             "man",
             "-d",
-            doctree_temp_location,
+            man_doctree_location,
             man_pages_destination_path,
         ]
     )
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from typing import Any
 
 import fnmatch
+import mmap
 import os
 import re
 import unicodedata
@@ -22,6 +23,31 @@ from collections.abc import Sequence
 
 from . import file_utils
 
+# NOTE: Only usable with ASCII strings. Non-ASCII upper/lower case characters can't be matched
+# with character classes.
+_uppercase_split_regex: re.Pattern = re.compile(r"(?<!^)(?=[A-Z])")
+_contiguous_uppercase_split_regex: re.Pattern = re.compile(
+    r"(?<=[a-z])(?=[A-Z])|(?<!^)(?=[A-Z][a-z])"
+)
+_exec_extensions: tuple[str, ...] = (".py", ".bash")
+_whitespace_regex: re.Pattern = re.compile(r"\s+")
+_invalid_filename_chars_regex: re.Pattern = re.compile(r"(?u)[^-\w.]")
+_invalid_slug_chars_regex: re.Pattern = re.compile(r"[^\w\s-]")
+_dashes_and_whitespace_regex: re.Pattern = re.compile(r"[-\s]+")
+_parent_dir_prefix: str = os.pardir + os.sep
+# NOTE: Sub-strings that make _substitute_string modify a string. Strings without any of them
+# are returned as is. Braces are for format fields (a lone one makes str.format_map() fail),
+# dollar/percent signs for environment variables, tildes for user home directories and double
+# backslashes for the workaround of a Sublime Text issue.
+_substitution_triggers: tuple[str, ...] = (
+    "{",
+    "}",
+    "$",
+    "~",
+    r"\\",
+    _parent_dir_prefix,
+) + (("%",) if os.name == "nt" else ())
+
 
 class __DictClone(UserDict):
     """__DictClone
@@ -73,6 +99,12 @@ def split_on_uppercase(string: str, keep_contiguous: bool = True) -> list:
     ['Hello', 'World']
     """
 
+    if string.isascii():
+        splitter: re.Pattern = (
+            _contiguous_uppercase_split_regex if keep_contiguous else _uppercase_split_regex
+        )
+        return splitter.split(string)
+
     string_length: int = len(string)
     is_lower_around: Callable[[int], bool] = (
         lambda i: string[i - 1].islower() or string_length > (i + 1) and string[i + 1].islower()
@@ -91,9 +123,140 @@ def split_on_uppercase(string: str, keep_contiguous: bool = True) -> list:
     return parts
 
 
+def _get_replacements(replacement_data: list[tuple[Any, Any]]) -> list[tuple[str, str]]:
+    """Get replacements.
+
+    Parameters
+    ----------
+    replacement_data : list[tuple[Any, Any]]
+        List of tuples containing (template, replacement) data.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        The (template, replacement) pairs as strings. Empty templates are ignored.
+    """
+    replacements: list[tuple[str, str]] = []
+
+    for template, replacement in replacement_data:
+        template = str(template)
+
+        if template:
+            replacements.append((template, str(replacement)))
+
+    return replacements
+
+
+def _strings_overlap(first: str, second: str) -> bool:
+    """Check if two strings can overlap when found in the same string.
+
+    Parameters
+    ----------
+    first : str
+        A string.
+    second : str
+        Another string.
+
+    Returns
+    -------
+    bool
+        If one of the strings contains the other or if the end of one of them is the start of
+        the other.
+    """
+    if first in second or second in first:
+        return True
+
+    return any(
+        first.endswith(second[:i]) or second.endswith(first[:i])
+        for i in range(1, min(len(first), len(second)))
+    )
+
+
+def _replacements_are_independent(replacements: list[tuple[str, str]]) -> bool:
+    """Check if replacements can be done in a single pass.
+
+    Parameters
+    ----------
+    replacements : list[tuple[str, str]]
+        The (template, replacement) pairs.
+
+    Returns
+    -------
+    bool
+        If doing all replacements in a single pass gives the same result as doing them one
+        after the other.
+    """
+    templates: list[str] = list(dict.fromkeys(template for template, _ in replacements))
+
+    # NOTE: Overlapping templates are replaced differently depending on the order in which
+    # they are replaced.
+    for i, template in enumerate(templates):
+        if any(_strings_overlap(template, other) for other in templates[i + 1 :]):
+            return False
+
+    # NOTE: Replacements that overlap templates can produce templates that are replaced
+    # afterwards. Empty replacements can do the same by joining the text around them.
+    for _, replacement in replacements:
+        if not replacement or any(_strings_overlap(replacement, t) for t in templates):
+            return False
+
+    return True
+
+
+def _compile_replacements(replacements: list[tuple[str, str]]) -> Callable[[str], str]:
+    """Compile replacements.
+
+    Parameters
+    ----------
+    replacements : list[tuple[str, str]]
+        The (template, replacement) pairs.
+
+    Returns
+    -------
+    Callable[[str], str]
+        A function that performs all replacements on the data passed to it.
+    """
+    if not replacements:
+        return lambda data: data
+
+    if not _replacements_are_independent(replacements):
+
+        def replace_sequentially(data: str) -> str:
+            for template, replacement in replacements:
+                if template in data:
+                    data = data.replace(template, replacement)
+
+            return data
+
+        return replace_sequentially
+
+    # NOTE: Independent replacements make repeated templates unreachable after their first
+    # replacement, so only the first replacement of a template is kept.
+    replacements_map: dict[str, str] = {}
+
+    for template, replacement in replacements:
+        replacements_map.setdefault(template, replacement)
+
+    # NOTE: If all templates are single characters, str.translate does the job.
+    if all(len(template) == 1 for template in replacements_map):
+        translation_table: dict[int, str] = str.maketrans(replacements_map)
+        return lambda data: data.translate(translation_table)
+
+    # NOTE: Independent templates never match at the same position, so the order of the
+    # alternatives doesn't matter.
+    pattern: re.Pattern = re.compile("|".join(map(re.escape, replacements_map)))
+
+    return lambda data: pattern.sub(lambda match: replacements_map[match.group(0)], data)
+
+
 def do_replacements(data: str, replacement_data: list[tuple[Any, Any]]) -> str:
     """Do replacements.
 
+    Templates are replaced one after the other in the given order, so a replacement can
+    produce a template that is replaced afterwards. When no template nor replacement can
+    overlap another template, all templates are replaced in a single pass over the data, which
+    gives the same result. Empty templates are ignored.
+
     Parameters
     ----------
     data : str
@@ -106,11 +269,80 @@ def do_replacements(data: str, replacement_data: list[tuple[Any, Any]]) -> str:
     str
         Modified data.
     """
-    for template, replacement in replacement_data:
-        if template in data:
-            data = data.replace(str(template), str(replacement))
+    return _compile_replacements(_get_replacements(replacement_data))(data)
+
+
+def _file_contains_any(file_path: str, needles: list[bytes]) -> bool:
+    """Check if a file contains any of the specified byte strings.
+
+    The file is memory mapped, so it isn't read into memory nor decoded.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file to check.
+    needles : list[bytes]
+        Byte strings to look for.
+
+    Returns
+    -------
+    bool
+        If any of the byte strings was found.
+    """
+    if not needles:
+        return False
+
+    with open(file_path, "rb") as file:
+        try:
+            mapped_file: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped.
+            return False
+
+        try:
+            return any(mapped_file.find(needle) != -1 for needle in needles)
+        finally:
+            mapped_file.close()
+
+
+def _walk_entries(
+    dir_path: str,
+) -> Generator[tuple[str, list[os.DirEntry], list[os.DirEntry]], None, None]:
+    """Walk a directory tree bottom-up.
+
+    Same as ``os.walk(dir_path, topdown=False)``, but yielding :py:class:`os.DirEntry` objects
+    instead of names.
+
+    Parameters
+    ----------
+    dir_path : str
+        Path to the directory to walk.
+
+    Yields
+    ------
+    Generator[tuple[str, list[os.DirEntry], list[os.DirEntry]], None, None]
+        A directory path, the entries of its sub-directories and the entries of its files.
+    """
+    dir_entries: list[os.DirEntry] = []
+    file_entries: list[os.DirEntry] = []
+
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir: bool = entry.is_dir()
+                except OSError:
+                    is_dir = False
 
-    return data
+                (dir_entries if is_dir else file_entries).append(entry)
+    except OSError:
+        return
+
+    for entry in dir_entries:
+        # NOTE: Do not follow symbolic links to directories, same as os.walk().
+        if not entry.is_symlink():
+            yield from _walk_entries(entry.path)
+
+    yield dir_path, dir_entries, file_entries
 
 
 def do_string_substitutions(
@@ -136,56 +368,71 @@ def do_string_substitutions(
         The logger.
     """
     logger.info("**Performing string substitutions...**")
+    replacements: list[tuple[str, str]] = _get_replacements(replacement_data)
+    replace: Callable[[str], str] = _compile_replacements(replacements)
+    templates: list[bytes] = [template.encode("UTF-8") for template, _ in replacements]
+    # NOTE: Matched with str.endswith, so entries can be compound extensions (e.g. ``.tar.gz``)
+    # or any other file name suffix.
+    extensions: tuple[str, ...] = (
+        (allowed_extensions,) if isinstance(allowed_extensions, str) else tuple(allowed_extensions)
+    )
+    # NOTE: Without templates there is nothing to rename.
+    rename_entries: bool = handle_file_names and bool(replacements)
+
+    for root, dir_entries, file_entries in _walk_entries(dir_path):
+        # NOTE: Used to build the paths of renamed entries by concatenation.
+        root_sep: str = os.path.join(root, "")
+
+        for file_entry in file_entries:
+            fname: str = file_entry.name
 
-    for root, dirs, files in os.walk(dir_path, topdown=False):
-        for fname in files:
             # Only deal with a limited set of file extensions.
-            if not fname.endswith(allowed_extensions):
+            if not fname.endswith(extensions):
                 continue
 
-            file_path: str = os.path.join(root, fname)
-
-            if os.path.islink(file_path):
+            if file_entry.is_symlink():
                 continue
 
-            with open(file_path, "r+", encoding="UTF-8") as file:
-                file_data = file.read()
-                file.seek(0)
-                new_file_data: str = do_replacements(file_data, replacement_data)
+            file_path: str = file_entry.path
+
+            # NOTE: Only read and re-write files that contain any of the templates.
+            if _file_contains_any(file_path, templates):
+                with open(file_path, "r+", encoding="UTF-8") as file:
+                    file_data = file.read()
+                    file.seek(0)
+                    new_file_data: str = replace(file_data)
 
-                if new_file_data != file_data:
-                    file.write(new_file_data)
-                    file.truncate()
+                    if new_file_data != file_data:
+                        file.write(new_file_data)
+                        file.truncate()
 
             # Check and set execution permissions for Bash and Python scripts.
             # FIXME: Should I hard-code the file names that should be set as executable?
             # I don't see a problem setting all Python files as exec., since I only use
             # Python scripts, not Python modules.
             # Lets put a pin on it and revisit in the future.
-            if fname.endswith((".py", ".bash")):
+            if fname.endswith(_exec_extensions):
                 if not file_utils.is_exec(file_path):
                     os.chmod(file_path, 0o755)
 
-            if handle_file_names:
-                fname_renamed: str = do_replacements(fname, replacement_data)
+            if rename_entries:
+                fname_renamed: str = replace(fname)
 
                 if fname != fname_renamed:
-                    os.rename(
-                        file_path,
-                        os.path.join(os.path.dirname(file_path), fname_renamed),
-                    )
+                    os.rename(file_path, root_sep + fname_renamed)
 
-        for dname in dirs:
-            dir_path: str = os.path.join(root, dname)
+        if not rename_entries:
+            continue
 
-            if os.path.islink(dir_path):
+        for dir_entry in dir_entries:
+            if dir_entry.is_symlink():
                 continue
 
-            if handle_file_names:
-                dname_renamed: str = do_replacements(dname, replacement_data)
+            dname: str = dir_entry.name
+            dname_renamed: str = replace(dname)
 
-                if dname != dname_renamed:
-                    os.rename(dir_path, os.path.join(os.path.dirname(dir_path), dname_renamed))
+            if dname != dname_renamed:
+                os.rename(dir_entry.path, root_sep + dname_renamed)
 
 
 def super_filter(
@@ -224,8 +471,13 @@ def super_filter(
     <https://codereview.stackexchange.com/a/74849>`__
     """
     included = multi_filter(names, inclusion_patterns) if inclusion_patterns else names
-    excluded = multi_filter(names, exclusion_patterns) if exclusion_patterns else []
-    return list(set(included) - set(excluded))
+
+    # NOTE: dict.fromkeys() removes duplicates while preserving the order of names.
+    if not exclusion_patterns:
+        return list(dict.fromkeys(included))
+
+    excluded = set(multi_filter(names, exclusion_patterns))
+    return [name for name in dict.fromkeys(included) if name not in excluded]
 
 
 def multi_filter(names: list[str], patterns: list[str]) -> Generator[str, None, None]:
@@ -245,8 +497,15 @@ def multi_filter(names: list[str], patterns: list[str]) -> Generator[str, None,
     Generator[str, None, None]
         A name in names parameter that matches any of the patterns in patterns parameter.
     """
+    # NOTE: Same as fnmatch.fnmatch(), but patterns are only normalized and compiled once.
+    matchers: list[Callable[[str], re.Match | None]] = [
+        re.compile(fnmatch.translate(os.path.normcase(pattern))).match for pattern in patterns
+    ]
+
     for name in names:
-        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+        normalized_name: str = os.path.normcase(name)
+
+        if any(match(normalized_name) for match in matchers):
             yield name
 
 
@@ -284,8 +543,8 @@ def get_valid_filename(string: str, separator: str = "_") -> str:
     >>> string_utils.get_valid_filename("john's portrait in 2004.jpg")
     'johns_portrait_in_2004.jpg'
     """
-    string = re.sub(r"\s+", separator, str(string).strip())
-    return re.sub(r"(?u)[^-\w.]", "", string)
+    string = _whitespace_regex.sub(separator, str(string).strip())
+    return _invalid_filename_chars_regex.sub("", string)
 
 
 def slugify(string: str, allow_unicode: bool = False) -> str:
@@ -322,14 +581,18 @@ def slugify(string: str, allow_unicode: bool = False) -> str:
     """
     string = str(string)
 
-    if allow_unicode:
-        string = unicodedata.normalize("NFKC", string)
-    else:
-        string = unicodedata.normalize("NFKD", string).encode("ascii", "ignore").decode("ascii")
+    # NOTE: Normalizing an ASCII string doesn't change it.
+    if not string.isascii():
+        if allow_unicode:
+            string = unicodedata.normalize("NFKC", string)
+        else:
+            string = (
+                unicodedata.normalize("NFKD", string).encode("ascii", "ignore").decode("ascii")
+            )
 
-    string = re.sub(r"[^\w\s-]", "", string).strip().lower()
+    string = _invalid_slug_chars_regex.sub("", string).strip().lower()
 
-    return re.sub(r"[-\s]+", "-", string)
+    return _dashes_and_whitespace_regex.sub("-", string)
 
 
 def substitute_variables(variables: dict, value: Any) -> Any:
@@ -356,24 +619,75 @@ def substitute_variables(variables: dict, value: Any) -> Any:
     ----
     Borrowed from SublimeLinter.
     """
-    if isinstance(value, str):
-        # Workaround https://github.com/SublimeTextIssues/Core/issues/1878
-        # (E.g. UNC paths on Windows start with double backslashes.)
-        value = value.replace(r"\\", r"\\\\")
+    # NOTE: The variables don't change while the data is processed, so a single __DictClone
+    # instance (which copies the variables) is used to format all strings found in the data.
+    variables_map: __DictClone = __DictClone(variables)
+
+    # NOTE: Walk the data with an explicit stack instead of recursion. Each entry is the container
+    # that will hold the substituted value, the key/index into it and the value to substitute.
+    # New containers are created (and placed into their parent) before their items are processed.
+    result: list = [None]
+    stack: list[tuple[dict | list, Any, Any]] = [(result, 0, value)]
+    stack_append = stack.append
+    stack_pop = stack.pop
+
+    while stack:
+        parent, key, val = stack_pop()
+
+        if isinstance(val, str):
+            parent[key] = _substitute_string(val, variables_map)
+        elif isinstance(val, Mapping):
+            new_dict: dict = {}
+            parent[key] = new_dict
+
+            for k, v in val.items():
+                # NOTE: Reserve the key so the original order is kept.
+                new_dict[k] = None
+                stack_append((new_dict, k, v))
+        elif isinstance(val, Sequence):
+            new_list: list = [None] * len(val)
+            parent[key] = new_list
+
+            for i, item in enumerate(val):
+                stack_append((new_list, i, item))
+        else:
+            parent[key] = val
+
+    return result[0]
+
+
+def _substitute_string(value: str, variables_map: __DictClone) -> str:
+    """Substitute variables in a string.
 
-        if os.pardir + os.sep in value:
-            value = os.path.normpath(value)
-
-        value = os.path.expandvars(os.path.expanduser(value))
+    Parameters
+    ----------
+    value : str
+        The string where to perform substitutions.
+    variables_map : __DictClone
+        The mapping passed to ``str.format_map()``.
 
-        return value.format_map(__DictClone(variables))
-    elif isinstance(value, Mapping):
-        return {key: substitute_variables(variables, val) for key, val in value.items()}
-    elif isinstance(value, Sequence):
-        return [substitute_variables(variables, item) for item in value]
+    Returns
+    -------
+    str
+        The modified string.
+    """
+    for trigger in _substitution_triggers:
+        if trigger in value:
+            break
     else:
         return value
 
+    # Workaround https://github.com/SublimeTextIssues/Core/issues/1878
+    # (E.g. UNC paths on Windows start with double backslashes.)
+    value = value.replace(r"\\", r"\\\\")
+
+    if _parent_dir_prefix in value:
+        value = os.path.normpath(value)
+
+    value = os.path.expandvars(os.path.expanduser(value))
+
+    return value.format_map(variables_map)
+
 
 if __name__ == "__main__":
     pass
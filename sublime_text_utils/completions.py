@@ -10,11 +10,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from python_utils import logging_system
     from python_utils.sublime_text_utils.settings import SettingsManager
 
 import html
 
+from functools import lru_cache
+from itertools import chain
+
 import sublime
 
 _completions_settings_keys: tuple = (
@@ -27,6 +31,17 @@ _completions_settings_keys: tuple = (
     ("inhibit_reorder", False),
 )
 
+# NOTE: The sublime module attributes used on every call, bound once.
+_CompletionItem: type[sublime.CompletionItem] = sublime.CompletionItem
+_CompletionList: type[sublime.CompletionList] = sublime.CompletionList
+
+_completions_list_flags: tuple[tuple[str, int], ...] = (
+    ("inhibit_word_completions", sublime.INHIBIT_WORD_COMPLETIONS),
+    ("inhibit_explicit_completions", sublime.INHIBIT_EXPLICIT_COMPLETIONS),
+    ("dynamic_completions", sublime.DYNAMIC_COMPLETIONS),
+    ("inhibit_reorder", sublime.INHIBIT_REORDER),
+)
+
 
 def get_kind(kind_name: str, t: str = "tuple") -> int | tuple[int, str, str]:
     """Get kind ID or tuple based on a kind name.
@@ -43,12 +58,85 @@ def get_kind(kind_name: str, t: str = "tuple") -> int | tuple[int, str, str]:
     int | tuple[int, str, str]
         A kind ID or tuple.
     """
+    return _get_kind_cached(kind_name, t)
+
+
+@lru_cache(maxsize=None)
+def _get_kind_cached(kind_name: str, t: str) -> int | tuple[int, str, str]:
+    """Get kind ID or tuple based on a kind name.
+
+    Parameters
+    ----------
+    kind_name : str
+        A kind name.
+    t : str
+        One of **tuple** or **id**.
+
+    Returns
+    -------
+    int | tuple[int, str, str]
+        A kind ID or tuple.
+
+    Note
+    ----
+    The ``sublime.KIND_*`` constants never change during a session, so the result of each lookup
+    is cached.
+    """
     fallback_attr = "KIND_ID_AMBIGUOUS" if t == "id" else "KIND_AMBIGUOUS"
     attr = "KIND_" + ("ID_" if t == "id" else "") + kind_name.upper()
 
     return getattr(sublime, attr, getattr(sublime, fallback_attr))
 
 
+def _build_completion_item(
+    c: dict,
+    kind: tuple[int, str, str],
+    completion_format: int,
+    format_details: Callable[[str], str] | None,
+) -> sublime.CompletionItem:
+    """Build completion item.
+
+    Parameters
+    ----------
+    c : dict
+        A completion definition.
+    kind : tuple[int, str, str]
+        A kind used in case the completion definition doesn't specify one.
+    completion_format : int
+        The format used in case the completion definition doesn't specify one.
+    format_details : Callable[[str], str] | None
+        Function that generates the ``details`` of a completion from its contents. Used in case
+        the completion definition doesn't specify its details.
+
+    Returns
+    -------
+    sublime.CompletionItem
+        A completion item.
+    """
+    contents: str = c["contents"]
+    k: str | list[str] = c.get("kind")
+
+    if isinstance(k, str):
+        item_kind = _get_kind_cached(k, "tuple")
+    elif isinstance(k, list):
+        item_kind = (_get_kind_cached(k[0], "id"), k[1], k[2])
+    else:
+        item_kind = kind
+
+    details: str = c.get("details") or (
+        format_details(contents) if format_details is not None else ""
+    )
+
+    return _CompletionItem(
+        trigger=c["trigger"],
+        completion=contents,
+        kind=item_kind,
+        completion_format=c.get("completion_format") or completion_format,
+        details=details,
+        annotation=c.get("annotation") or "",
+    )
+
+
 def create_completions_list(
     settings: SettingsManager,
     settings_prefix: str = "",
@@ -93,41 +181,52 @@ def create_completions_list(
         logger.error(err)
 
     ody_all_completions: sublime.CompletionList | list = []
-    completions_items: list[sublime.CompletionItem] = []
 
     try:
-        for c in completions_settings["completions"] + completions_settings["completions_user"]:
-            item_args: dict = {
-                "trigger": c["trigger"],
-                "completion": c["contents"],
-            }
-            k: str | list[str] = c.get("kind")
-
-            if isinstance(k, str):
-                item_args["kind"] = get_kind(k, t="tuple")
-            elif isinstance(k, list):
-                item_args["kind"] = (get_kind(k[0], t="id"), k[1], k[2])
-            else:
-                item_args["kind"] = kind
-
-            item_args["completion_format"] = c.get("completion_format") or completion_format
-            item_args["details"] = c.get("details") or (
-                details_template.format(html.escape(c["contents"])) if details_template else ""
+        format_details: Callable[[str], str] | None = None
+
+        if details_template:
+            # NOTE: Many completions can share the same contents.
+            details_cache: dict[str, str] = {}
+
+            def _format_details_cached(contents: str) -> str:
+                """Format details.
+
+                Parameters
+                ----------
+                contents : str
+                    The contents of a completion.
+
+                Returns
+                -------
+                str
+                    The details of the completion.
+                """
+                details: str | None = details_cache.get(contents)
+
+                if details is None:
+                    details = details_cache[contents] = details_template.format(
+                        html.escape(contents)
+                    )
+
+                return details
+
+            format_details = _format_details_cached
+
+        completions_items: list[sublime.CompletionItem] = [
+            _build_completion_item(c, kind, completion_format, format_details)
+            for c in chain(
+                completions_settings["completions"], completions_settings["completions_user"]
             )
+        ]
 
-            if c.get("annotation"):
-                item_args["annotation"] = c.get("annotation")
+        flags: int = 0
 
-            completions_items.append(sublime.CompletionItem(**item_args))
+        for key, flag in _completions_list_flags:
+            if completions_settings[key]:
+                flags |= flag
 
-        ody_all_completions = sublime.CompletionList(
-            completions_items,
-            completions_settings["inhibit_word_completions"] * sublime.INHIBIT_WORD_COMPLETIONS
-            | completions_settings["inhibit_explicit_completions"]
-            * sublime.INHIBIT_EXPLICIT_COMPLETIONS
-            | completions_settings["dynamic_completions"] * sublime.DYNAMIC_COMPLETIONS
-            | completions_settings["inhibit_reorder"] * sublime.INHIBIT_REORDER,
-        )
+        ody_all_completions = _CompletionList(completions_items, flags)
     except KeyError:
         sublime.status_message("Error updating completions")
         ody_all_completions = []
@@ -20,8 +20,21 @@ class CustomListInputItem(sublime.ListInputItem):
     prop_for_sort : Any
         Property to store data for sorting used in case that the data stored in the default
         properties of a ``sublime.ListInputItem`` object aren't usefull/needed/wanted for sorting.
+
+    Note
+    ----
+    The transformed value used for comparisons is computed once on initialization. Changing the
+    value of the property used for sorting afterwards will not change the sort order.
+
+    Lists of these items should be sorted with :py:meth:`CustomListInputItem.sort_key` as the key
+    function (``items.sort(key=CustomListInputItem.sort_key)``). It is called once per item
+    instead of calling the comparison methods once per comparison.
     """
 
+    # NOTE: sublime.ListInputItem doesn't define __slots__, so instances still have a __dict__ for
+    # its attributes. Only the attributes defined by this class are stored in slots.
+    __slots__ = ("_sort_prop", "_transform", "prop_for_sort", "_sort_key")
+
     def __init__(
         self,
         *args,
@@ -51,6 +64,23 @@ class CustomListInputItem(sublime.ListInputItem):
         self._sort_prop: str = sort_prop
         self._transform: Callable[..., Any] = transform
         self.prop_for_sort: Any = prop_for_sort_val
+        self._sort_key: Any = transform(getattr(self, sort_prop))
+
+    @staticmethod
+    def sort_key(item: CustomListInputItem) -> Any:
+        """Key function to sort lists of these items.
+
+        Parameters
+        ----------
+        item : CustomListInputItem
+            An item to sort.
+
+        Returns
+        -------
+        Any
+            The transformed value used to sort the item.
+        """
+        return item._sort_key
 
     def __lt__(self, other: CustomListInputItem) -> bool:
         """Less than comparison.
@@ -65,9 +95,7 @@ class CustomListInputItem(sublime.ListInputItem):
         bool
             Result of the comparison.
         """
-        return self._transform(getattr(self, self._sort_prop)) < self._transform(
-            getattr(other, self._sort_prop)
-        )
+        return self._sort_key < other._sort_key
 
     def __gt__(self, other: CustomListInputItem) -> bool:
         """Greater than comparison.
@@ -82,9 +110,7 @@ class CustomListInputItem(sublime.ListInputItem):
         bool
             Result of the comparison.
         """
-        return self._transform(getattr(self, self._sort_prop)) > self._transform(
-            getattr(other, self._sort_prop)
-        )
+        return self._sort_key > other._sort_key
 
     def __le__(self, other: CustomListInputItem) -> bool:
         """Less than or equal comparison.
@@ -99,9 +125,7 @@ class CustomListInputItem(sublime.ListInputItem):
         bool
             Result of the comparison.
         """
-        return self._transform(getattr(self, self._sort_prop)) <= self._transform(
-            getattr(other, self._sort_prop)
-        )
+        return self._sort_key <= other._sort_key
 
     def __ge__(self, other: CustomListInputItem) -> bool:
         """Greater than or equal comparison.
@@ -116,9 +140,7 @@ class CustomListInputItem(sublime.ListInputItem):
         bool
             Result of the comparison.
         """
-        return self._transform(getattr(self, self._sort_prop)) >= self._transform(
-            getattr(other, self._sort_prop)
-        )
+        return self._sort_key >= other._sort_key
 
     def __eq__(self, other: object) -> bool:
         """Equal comparison.
@@ -133,9 +155,7 @@ class CustomListInputItem(sublime.ListInputItem):
         bool
             Result of the comparison.
         """
-        return self._transform(getattr(self, self._sort_prop)) == self._transform(
-            getattr(other, self._sort_prop)
-        )
+        return self._sort_key == other._sort_key
 
     def __ne__(self, other: object) -> bool:
         """Non-equal comparison.
@@ -150,9 +170,7 @@ class CustomListInputItem(sublime.ListInputItem):
         bool
             Result of the comparison.
         """
-        return self._transform(getattr(self, self._sort_prop)) != self._transform(
-            getattr(other, self._sort_prop)
-        )
+        return self._sort_key != other._sort_key
 
 
 if __name__ == "__main__":
@@ -7,35 +7,32 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterator
     from typing import Any
 
 import traceback
 
-from collections import defaultdict
-
 
 class Events:
     """docstring for Events
 
     Attributes
     ----------
-    listeners : defaultdict
-        Functions storage.
+    listeners : dict[str, tuple[Callable[..., Any], ...]]
+        Functions storage. Functions are stored in the order they were registered.
     map_fn_to_topic : dict
         Functions to topics map.
     """
 
     def __init__(self) -> None:
         """See :py:meth:`object.__init__`."""
-        self.listeners: defaultdict = defaultdict(set)
+        self.listeners: dict[str, tuple[Callable[..., Any], ...]] = {}
         self.map_fn_to_topic: dict = {}
 
     def destroy(self) -> None:
         """Perform cleanup of all stored events."""
         self.listeners.clear()
         self.map_fn_to_topic.clear()
-        self.listeners = defaultdict(set)
-        self.map_fn_to_topic = {}
 
     def subscribe(self, topic: str, fn: Callable[..., Any]) -> None:
         """Register event.
@@ -47,7 +44,10 @@ class Events:
         fn : Callable[..., Any]
             Method to register.
         """
-        self.listeners[topic].add(fn)
+        listeners: tuple[Callable[..., Any], ...] = self.listeners.get(topic, ())
+
+        if fn not in listeners:
+            self.listeners[topic] = listeners + (fn,)
 
     def unsubscribe(self, topic: str, fn: Callable[..., Any]) -> None:
         """Unregister event.
@@ -59,26 +59,63 @@ class Events:
         fn : Callable[..., Any]
             Method to unregister.
         """
-        try:
-            self.listeners[topic].remove(fn)
-        except KeyError:
-            pass
+        listeners: tuple[Callable[..., Any], ...] = self.listeners.get(topic, ())
+
+        if fn in listeners:
+            remaining: tuple[Callable[..., Any], ...] = tuple(f for f in listeners if f != fn)
+
+            if remaining:
+                self.listeners[topic] = remaining
+            else:
+                del self.listeners[topic]
+
+    def has_listeners(self, topic: str) -> bool:
+        """Check if an event has registered functions.
+
+        Parameters
+        ----------
+        topic : str
+            Event name.
+
+        Returns
+        -------
+        bool
+            If there are functions registered for the event.
+        """
+        return topic in self.listeners
 
-    def broadcast(self, topic: str, payload: dict = {}) -> None:
+    def broadcast(self, topic: str, payload: dict | None = None) -> None:
         """Emit event.
 
         Parameters
         ----------
         topic : str
             Event name.
-        payload : dict, optional
+        payload : dict | None, optional
             Parameters passed to executed method.
+
+        Note
+        ----
+        The handlers called are the ones registered for the topic when the broadcast starts.
+        Handlers can subscribe/unsubscribe functions to/from the topic; the changes take effect
+        on the next broadcast.
         """
-        for fn in self.listeners.get(topic, []):
+        # NOTE: A single try statement for the whole loop instead of one per handler. If a handler
+        # raises, the loop is resumed from the handler that follows it.
+        listeners: Iterator[Callable[..., Any]] = iter(self.listeners.get(topic, ()))
+
+        while True:
             try:
-                fn(**payload)
+                if payload:
+                    for fn in listeners:
+                        fn(**payload)
+                else:
+                    for fn in listeners:
+                        fn()
             except Exception:
                 traceback.print_exc()
+            else:
+                break
 
     def on(self, topic: str) -> Callable[[Callable[..., Any]], Any]:
         """Event registration decorator.
@@ -24,6 +24,11 @@ SOFTWARE.
 """
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 import sublime
 
 from ..diff_match_patch import diff_match_patch
@@ -59,38 +64,46 @@ def _merge_code(view: sublime.View, edit: sublime.Edit, original: str, modified:
     MergeException
         Error merging.
     """
+    # NOTE: The segments of the diff that are kept or deleted make up the original string. So
+    # checking once that the buffer starts with it is the same as checking each of those segments
+    # while editing the buffer.
+    if view.substr(sublime.Region(0, len(original))) != original:
+        raise MergeException("mismatch", False)
+
     dmp: diff_match_patch = diff_match_patch()
     diffs: list[tuple[int, str]] = dmp.diff_main(original, modified)
     dmp.diff_cleanupEfficiency(diffs)
     i: int = 0
-    dirty: bool = False
+    # NOTE: Edits are stored with positions in the original buffer as tuples of start, end and
+    # text to insert (None for deletions). They are applied in reverse order so the positions of
+    # the pending edits aren't moved by the ones already applied.
+    edits: list[tuple[int, int, str | None]] = []
 
     for k, s in diffs:
         ln: int = len(s)
 
         if k == 0:
             # match
-            ln = len(s)
-
-            if view.substr(sublime.Region(i, i + ln)) != s:
-                raise MergeException("mismatch", dirty)
-
             i += ln
+        elif k > 0:
+            # insert
+            edits.append((i, i, s))
         else:
-            dirty = True
+            # delete
+            edits.append((i, i + ln, None))
+            i += ln
 
-            if k > 0:
-                # insert
-                view.insert(edit, i, s)
-                i += ln
-            else:
-                # delete
-                if view.substr(sublime.Region(i, i + ln)) != s:
-                    raise MergeException("mismatch", dirty)
+    insert: Callable[[sublime.Edit, int, str], int] = view.insert
+    erase: Callable[[sublime.Edit, sublime.Region], None] = view.erase
+    Region: type[sublime.Region] = sublime.Region
 
-                view.erase(edit, sublime.Region(i, i + ln))
+    for start, end, s in reversed(edits):
+        if s is None:
+            erase(edit, Region(start, end))
+        else:
+            insert(edit, start, s)
 
-    return dirty
+    return bool(edits)
 
 
 def merge_code(
@@ -117,7 +130,7 @@ def merge_code(
     vs: sublime.Settings = view.settings()
     ttts: bool = vs.get("translate_tabs_to_spaces")
 
-    if not original.strip():
+    if not original or original.isspace() or original == modified:
         return (False, "")
 
     vs.set("translate_tabs_to_spaces", False)
@@ -9,23 +9,37 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any
 
-import threading
+from itertools import count
+
+import sublime
 
 
 class Queue:
     """Queue manager.
 
+    Executions are scheduled with ``sublime.set_timeout_async``, so no thread is created per
+    debounced call and callbacks are executed in Sublime Text's asynchronous thread.
+
     Attributes
     ----------
-    timers : dict[str, threading.Timer]
-        Timers storage.
+    tokens : dict[str, int]
+        Tokens of the last scheduled execution of each registration key. A scheduled execution
+        only calls its callback if its token is still the one stored for its key.
+
+    Note
+    ----
+    Scheduled executions can't be cancelled. Cancelling a key only makes its pending execution
+    do nothing when its delay expires.
     """
 
     def __init__(self) -> None:
         """See :py:meth:`object.__init__`."""
-        self.timers: dict[str, threading.Timer] = {}
+        self.tokens: dict[str, int] = {}
+        # NOTE: Tokens are unique for all keys. Per key counters would make an execution that was
+        # scheduled before a key was cleaned up valid again if the key is debounced afterwards.
+        self._token_counter: count = count(1)
 
-    def debounce(self, callback: Callable[..., Any], delay: int, key: str) -> threading.Timer:
+    def debounce(self, callback: Callable[..., Any], delay: int, key: str) -> int:
         """Execute a method after a delay.
 
         Parameters
@@ -39,17 +53,27 @@ class Queue:
 
         Returns
         -------
-        threading.Timer
-            Instantiated timer.
+        int
+            Token of the scheduled execution.
         """
-        try:
-            self.timers[key].cancel()
-        except KeyError:
-            pass
+        self.tokens[key] = token = next(self._token_counter)
+        sublime.set_timeout_async(lambda: self._execute(callback, key, token), delay)
+        return token
 
-        self.timers[key] = timer = threading.Timer(delay / 1000, callback)
-        timer.start()
-        return timer
+    def _execute(self, callback: Callable[..., Any], key: str, token: int) -> None:
+        """Execute a debounced method if it wasn't superseded or cancelled.
+
+        Parameters
+        ----------
+        callback : Callable[..., Any]
+            Method to execute.
+        key : str
+            Timer registration key.
+        token : int
+            Token of the scheduled execution.
+        """
+        if self.tokens.get(key) == token:
+            callback()
 
     def cleanup(self, key: str) -> None:
         """Unregister a timer.
@@ -59,26 +83,11 @@ class Queue:
         key : str
             Timer registration key.
         """
-        try:
-            self.timers.pop(key).cancel()
-        except KeyError:
-            pass
+        self.tokens.pop(key, None)
 
     def unload(self) -> None:
-        """Unregister all timers.
-
-        Returns
-        -------
-        None
-            Stop looping(?).
-        """
-        while True:
-            try:
-                _key, timer = self.timers.popitem()
-            except KeyError:
-                return
-            else:
-                timer.cancel()
+        """Unregister all timers."""
+        self.tokens.clear()
 
 
 if __name__ == "__main__":
@@ -10,11 +10,15 @@ if TYPE_CHECKING:
     from typing import Any
 
 import threading
+import traceback
 
 
 class RepeatingTimer:
     """Repeating timer.
 
+    A single thread executes the function every ``interval_s`` seconds until the timer is
+    cancelled.
+
     Attributes
     ----------
     args : tuple
@@ -27,10 +31,21 @@ class RepeatingTimer:
         Timer running flag.
     kwargs : dict
         Keyword argumentsto pass to the executed function.
-    timer : threading.Timer | None
-        The timer instance.
+    timer : threading.Thread | None
+        The thread running the timer.
     """
 
+    __slots__ = (
+        "interval_s",
+        "func",
+        "args",
+        "kwargs",
+        "timer",
+        "is_running",
+        "_stop_event",
+        "__weakref__",
+    )
+
     def __init__(self, interval_ms: int | float, func: Callable[..., Any], *args, **kwargs) -> None:
         """Initialization.
 
@@ -49,8 +64,9 @@ class RepeatingTimer:
         self.func: Callable[..., Any] = func
         self.args: tuple = args
         self.kwargs: dict = kwargs
-        self.timer: threading.Timer | None = None
+        self.timer: threading.Thread | None = None
         self.is_running: bool = False
+        self._stop_event: threading.Event = threading.Event()
 
     def set_func(self, func: Callable[..., Any], *args, **kwargs) -> None:
         """Set timer function callback.
@@ -80,17 +96,35 @@ class RepeatingTimer:
 
     def start(self) -> None:
         """Start timer."""
-        self.timer = threading.Timer(self.interval_s, self._callback)
+        # NOTE: Stop a previous run, if any. Each run gets its own event so that a cancelled run
+        # can't be resumed by a later one.
+        self._stop_event.set()
+        self._stop_event = stop_event = threading.Event()
+        self.timer = threading.Thread(target=self._run, args=(stop_event,), daemon=True)
         self.timer.start()
         self.is_running = True
 
     def cancel(self) -> None:
-        """Cancel timer."""
-        assert isinstance(self.timer, threading.Timer)
-        self.timer.cancel()
+        """Cancel timer.
+
+        Cancelling a timer that isn't running does nothing.
+        """
+        self._stop_event.set()
         self.is_running = False
 
-    def _callback(self) -> None:
-        """Method that the timer will call."""
-        self.func(*self.args, **self.kwargs)
-        self.start()
+    def _run(self, stop_event: threading.Event) -> None:
+        """Execute the timer function on every interval until the timer is cancelled.
+
+        Parameters
+        ----------
+        stop_event : threading.Event
+            The event that is set when the timer is cancelled.
+        """
+        # NOTE: The interval is read on every iteration so that changes made with set_interval
+        # take effect after the current wait.
+        while not stop_event.wait(self.interval_s):
+            # NOTE: An exception raised by the function must not stop the timer.
+            try:
+                self.func(*self.args, **self.kwargs)
+            except Exception:
+                traceback.print_exc()
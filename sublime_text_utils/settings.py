@@ -11,12 +11,21 @@ if TYPE_CHECKING:
     from python_utils.sublime_text_utils.events import Events
     from typing import Any
 
+from collections import OrderedDict
+from functools import lru_cache
 from functools import wraps
+from types import MappingProxyType
 
 import sublime
 import sublime_plugin
 
-from .. import misc_utils
+# NOTE: Marks values missing from a state dictionary, since None can be a stored value.
+_missing: object = object()
+# NOTE: Read-only empty mapping used as a default for lookups.
+_empty_mapping: MappingProxyType = MappingProxyType({})
+_distinct_buffers_max: int = 64
+# NOTE: Settings objects shared by all SettingsManager instances that handle the same file.
+_settings_handles: dict[str, sublime.Settings] = {}
 
 
 class SettingsManager:
@@ -37,6 +46,25 @@ class SettingsManager:
     Borrowed from SublimeLinter.
     """
 
+    __slots__ = (
+        "events",
+        "logger",
+        "name_space",
+        "_is_native_settings",
+        "_pref_file",
+        "_reload_key",
+        "_previous_state",
+        "_current_state",
+        "__project_settings",
+        "__project_settings_valid",
+        "__settings",
+        "_change_count",
+        "_settings_snapshot",
+        "_observed",
+        "_broadcast_payload",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         settings_file: str = "Preferences",
@@ -59,21 +87,30 @@ class SettingsManager:
         self.logger: logging_system.Logger | None = logger
         self.name_space: str = self._get_name_space(settings_file)
         self._is_native_settings: bool = settings_file == "Preferences"
-        self._pref_file: str = "%s.sublime-settings" % settings_file
-        self._reload_key: str = misc_utils.get_date_time(type="function_name")
+        self._pref_file: str = f"{settings_file}.sublime-settings"
+        # NOTE: The key only needs to be unique among the change callbacks of a settings file.
+        # Object IDs are unique among living objects of the plugin host, even across plugins.
+        self._reload_key: str = f"settings_reload_{id(self):x}"
         self._previous_state: dict = {}
         self._current_state: dict = {}
         self.__project_settings: dict = {}
+        self.__project_settings_valid: bool = False
         self.__settings: sublime.Settings = None
         self._change_count: int = 0
+        self._settings_snapshot: dict | None = None
+        self._observed: bool = False
+        self._broadcast_payload: dict[str, SettingsManager] = {"settings_obj": self}
 
     def load(self) -> None:
         """Load the plugin settings."""
-        self.__project_settings.clear()
+        self.__project_settings_valid = False
+        self._settings_snapshot = self.settings.to_dict()
         self.observe()
         self.on_update()
 
-    def _get_name_space(self, settings_file: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_name_space(settings_file: str) -> str:
         """Get namespace key.
 
         Parameters
@@ -86,19 +123,21 @@ class SettingsManager:
         str
             Namespace key.
         """
-        name_space_key: str = settings_file[0].lower()
+        name_space_chars: list[str] = [settings_file[0].lower()]
         last_upper: bool = False
 
         for c in settings_file[1:]:
-            if c.isupper() and not last_upper:
-                name_space_key += "_"
-                name_space_key += c.lower()
+            is_upper: bool = c.isupper()
+
+            if is_upper and not last_upper:
+                name_space_chars.append("_")
+                name_space_chars.append(c.lower())
             else:
-                name_space_key += c
+                name_space_chars.append(c)
 
-            last_upper = c.isupper()
+            last_upper = is_upper
 
-        return name_space_key
+        return "".join(name_space_chars)
 
     @property
     def settings(self) -> sublime.Settings:
@@ -112,7 +151,12 @@ class SettingsManager:
         s: sublime.Settings = self.__settings
 
         if s is None:
-            s = self.__settings = sublime.load_settings(self._pref_file)
+            s = _settings_handles.get(self._pref_file)
+
+            if s is None:
+                s = _settings_handles[self._pref_file] = sublime.load_settings(self._pref_file)
+
+            self.__settings = s
 
         return s
 
@@ -125,23 +169,29 @@ class SettingsManager:
         dict
             A project settings object.
         """
-        s: dict = self.__project_settings
-
-        if not s:
-            try:
-                if self._is_native_settings:
-                    s = self.__project_settings = (
-                        sublime.active_window().project_data().get("settings", {})
-                    )
-                else:
-                    s = self.__project_settings = (
-                        sublime.active_window()
-                        .project_data()
-                        .get("settings", {})
-                        .get(self.name_space, {})
-                    )
-            except Exception:
-                s = {}
+        # NOTE: Empty project settings are cached too. They are re-read only after load() or
+        # on_update() are called. Failing to read them isn't cached.
+        if self.__project_settings_valid:
+            return self.__project_settings
+
+        window: sublime.Window | None = sublime.active_window()
+
+        if window is None:
+            return {}
+
+        try:
+            # NOTE: A window without a project has no project data.
+            all_settings: dict = (window.project_data() or _empty_mapping).get(
+                "settings", _empty_mapping
+            )
+            s: dict = (
+                all_settings if self._is_native_settings else all_settings.get(self.name_space)
+            ) or {}
+        except Exception:
+            return {}
+
+        self.__project_settings = s
+        self.__project_settings_valid = True
 
         return s
 
@@ -175,13 +225,15 @@ class SettingsManager:
         Any
             The setting value or the default value.
         """
-        try:
-            return self._current_state[name]
-        except KeyError:
-            global_value: Any = self.settings.get(name, default)
-            project_value: Any = self.project_settings.get(name, global_value)
-            self._current_state[name] = project_value
-            return project_value
+        value: Any = self._current_state.get(name, _missing)
+
+        if value is not _missing:
+            return value
+
+        global_value: Any = self.settings.get(name, default)
+        project_value: Any = self.project_settings.get(name, global_value)
+        self._current_state[name] = project_value
+        return project_value
 
     def set(self, name: str, value: Any) -> None:
         """Set setting value.
@@ -214,12 +266,12 @@ class SettingsManager:
             If the setting has changed.
         """
         current_value: Any = self.get(name)
-        try:
-            old_value: Any = self._previous_state[name]
-        except KeyError:
+        old_value: Any = self._previous_state.get(name, _missing)
+
+        if old_value is _missing:
             return False
-        else:
-            return old_value != current_value
+
+        return old_value != current_value
 
     def change_count(self) -> int:
         """Change count.
@@ -233,21 +285,42 @@ class SettingsManager:
 
     def observe(self) -> None:
         """Observe changes."""
+        if self._observed:
+            return
+
         self.settings.clear_on_change(self._reload_key)
-        self.settings.add_on_change(self._reload_key, self.on_update)
+        self.settings.add_on_change(self._reload_key, self._on_settings_change)
+        self._observed = True
 
     def unobserve(self) -> None:
         """Stop observing for changes."""
         self.settings.clear_on_change(self._reload_key)
+        self._observed = False
+
+    def _on_settings_change(self) -> None:
+        """Update state only if the settings actually changed.
+
+        Sublime Text can call the settings change callbacks more than once for a single change.
+        """
+        settings_snapshot: dict = self.settings.to_dict()
+
+        if settings_snapshot == self._settings_snapshot:
+            return
+
+        self._settings_snapshot = settings_snapshot
+        self.on_update()
 
     def on_update(self) -> None:
         """Update state when the user settings change."""
-        self._previous_state = self._current_state.copy()
-        self._current_state.clear()
+        # NOTE: The current state becomes the previous state as is. A new dictionary is used for
+        # the current state, so there is no need to copy it.
+        self._previous_state = self._current_state
+        self._current_state = {}
+        self.__project_settings_valid = False
         self._change_count += 1
 
-        if self.events is not None:
-            self.events.broadcast("settings_changed", {"settings_obj": self})
+        if self.events is not None and self.events.has_listeners("settings_changed"):
+            self.events.broadcast("settings_changed", self._broadcast_payload)
 
 
 class SettingsToggleBoolean:
@@ -300,7 +373,7 @@ class SettingsToggleBoolean:
         try:
             new_val: bool = not self.ody_settings.get(self.ody_key, False)
             self.ody_settings.set(self.ody_key, new_val)
-            sublime.status_message("%s changed to %r" % (self.ody_key, new_val))
+            sublime.status_message(f"{self.ody_key} changed to {new_val!r}")
         except Exception as err:
             print(err)
 
@@ -376,7 +449,7 @@ class SettingsToggleList:
             old_val: str = self.ody_settings.get(self.ody_key, "")
             new_val: str = self.ody_get_new_value(old_val)
             self.ody_settings.set(self.ody_key, new_val)
-            sublime.status_message("%s changed to %r" % (self.ody_key, new_val))
+            sublime.status_message(f"{self.ody_key} changed to {new_val!r}")
         except Exception as err:
             print(err)
 
@@ -395,16 +468,18 @@ class SettingsToggleList:
         """
         val_idx: int = 0
 
+        # NOTE: Looked up in the current list on each call. The values can be unhashable (e.g.
+        # lists or dictionaries) and the list can be modified after initialization.
         try:
             # Get index of value that's after current value.
             val_idx = self.ody_values_list.index(old_val) + 1
         except ValueError:
             pass
 
-        try:
+        if val_idx < len(self.ody_values_list):
             return self.ody_values_list[val_idx]
-        except IndexError:
-            return self.ody_values_list[0]
+
+        return self.ody_values_list[0]
 
     def description(self) -> str:
         """Command description.
@@ -437,7 +512,9 @@ def distinct_until_buffer_changed(method: Callable[..., None]) -> Callable[...,
     Callable[..., None]
         Wrapped method.
     """
-    last_call: tuple[int, int] = (0, 0)
+    # NOTE: Change count of the last call for each buffer. Only the most recently used buffers
+    # are kept.
+    last_calls: OrderedDict[int, int] = OrderedDict()
 
     @wraps(method)
     def wrapper(self: object, view: sublime.View) -> None:
@@ -453,13 +530,18 @@ def distinct_until_buffer_changed(method: Callable[..., None]) -> Callable[...,
         None
             Halt execution.
         """
-        nonlocal last_call
+        buffer_id: int = view.buffer_id()
+        change_count: int = view.change_count()
 
-        this_call: tuple[int, int] = (view.buffer_id(), view.change_count())
-        if this_call == last_call:
+        if last_calls.get(buffer_id) == change_count:
             return
 
-        last_call = this_call
+        last_calls[buffer_id] = change_count
+        last_calls.move_to_end(buffer_id)
+
+        if len(last_calls) > _distinct_buffers_max:
+            last_calls.popitem(last=False)
+
         method(self, view)
 
     return wrapper
@@ -480,10 +562,10 @@ class ProjectSettingsController(sublime_plugin.EventListener):
         """
         window: sublime.Window = view.window()
         filename: str | None = view.file_name()
+        # NOTE: load() doesn't depend on the window that holds the project, so it's called once
+        # even if the project is opened in several windows.
         if window and filename and window.project_file_name() == filename:
-            for window in sublime.windows():
-                if window.project_file_name() == filename:
-                    settings.load()
+            settings.load()
 
 
 if __name__ == "__main__":
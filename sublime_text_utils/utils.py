@@ -10,17 +10,34 @@ if TYPE_CHECKING:
     from typing import Any
 
 import os
+import re
 import sys
 
 from collections import ChainMap
 from collections.abc import Mapping
 from collections.abc import Sequence
+from functools import lru_cache
 
 import sublime
 import sublime_plugin
 
 from .. import cmd_utils
 
+# NOTE: Only executables that were found are stored, so programs that are installed afterwards
+# are found without having to restart.
+_found_executables: set[str] = set()
+# NOTE: Strings that don't contain any of these are left untouched by substitute_variables.
+# Dollar signs are for variables, tildes for user home directories, backslashes for escapes and
+# for the workaround of a Sublime Text issue, parent directories for normalization and, on
+# Windows, percent signs for environment variables.
+_substitution_triggers_regex: re.Pattern = re.compile(
+    "|".join(
+        re.escape(trigger)
+        for trigger in ("$", "~", "\\", os.pardir + os.sep)
+        + (("%",) if os.name == "nt" else ())
+    )
+)
+
 
 def evaluate_scope_selector(view: sublime.View, value: bool | str | list[str]) -> bool:
     """Evaluate scope selector.
@@ -60,16 +77,50 @@ def is_editable_view(view: sublime.View) -> bool:
     bool
         If ``view`` is editable.
     """
-    return all(
-        (
-            view and not view.element(),
-            view and not view.is_scratch(),
-            view and not view.is_read_only(),
-            view and not view.is_loading(),
-        )
+    return (
+        bool(view)
+        and not view.element()
+        and not view.is_scratch()
+        and not view.is_read_only()
+        and not view.is_loading()
     )
 
 
+@lru_cache(maxsize=256)
+def _get_syntax_name(syntax_path: str | None) -> str:
+    """Get syntax name.
+
+    Parameters
+    ----------
+    syntax_path : str | None
+        The path to a syntax file as stored in the ``syntax`` setting of a view.
+
+    Returns
+    -------
+    str
+        The lower cased file name of the syntax file.
+    """
+    # NOTE: Views without a syntax have no ``syntax`` setting.
+    return (syntax_path or "").rpartition("/")[2].lower()
+
+
+@lru_cache(maxsize=256)
+def _get_lowered_syntaxes(view_syntaxes: tuple[str, ...]) -> frozenset[str]:
+    """Get lowered syntaxes.
+
+    Parameters
+    ----------
+    view_syntaxes : tuple[str, ...]
+        Syntaxes to lower case.
+
+    Returns
+    -------
+    frozenset[str]
+        The lower cased syntaxes.
+    """
+    return frozenset(s.lower() for s in view_syntaxes)
+
+
 def has_right_syntax(
     view: sublime.View, view_syntaxes: str | list[str] = [], strict: bool = False
 ) -> bool:
@@ -91,15 +142,15 @@ def has_right_syntax(
     bool
         If the view has the right syntax.
     """
-    syntax = view.settings().get("syntax").split("/")[-1].lower()
+    syntax = _get_syntax_name(view.settings().get("syntax"))
 
     if isinstance(view_syntaxes, list):
-        return any(
-            [
-                (s.lower() == syntax if strict else s.lower() in syntax)
-                for s in view_syntaxes
-            ]
-        )
+        lowered_syntaxes: frozenset[str] = _get_lowered_syntaxes(tuple(view_syntaxes))
+
+        if strict:
+            return syntax in lowered_syntaxes
+
+        return any(s in syntax for s in lowered_syntaxes)
     elif isinstance(view_syntaxes, str):
         return (
             view_syntaxes.lower() == syntax
@@ -160,26 +211,47 @@ def get_selections(
     list[sublime.Region]
         A list of regions.
     """
-    selections: list[sublime.Region] = []
+    if not view:
+        return []
+
+    selections: list[sublime.Region]
+
+    if extract_words:
+        selections = []
 
-    if view:
         for region in view.sel():
-            if extract_words and region.empty():
+            if region.empty():
                 word = view.word(region)
 
                 if word:
                     selections.append(word)
-                    continue
-
-            if not region.empty():
+            else:
                 selections.append(region)
+    else:
+        selections = [region for region in view.sel() if not region.empty()]
 
-        if len(selections) == 0 and return_whole_file:
-            selections.append(sublime.Region(0, view.size()))
+    if not selections and return_whole_file:
+        selections.append(sublime.Region(0, view.size()))
 
     return selections
 
 
+def _get_replacement_begin(replacement: tuple[sublime.Region, str]) -> int:
+    """Get the begin point of a replacement region.
+
+    Parameters
+    ----------
+    replacement : tuple[sublime.Region, str]
+        A region and the text that will be placed into it.
+
+    Returns
+    -------
+    int
+        The begin point of the region.
+    """
+    return replacement[0].begin()
+
+
 def replace_all_selections(
     view: sublime.View,
     edit: sublime.Edit,
@@ -198,18 +270,30 @@ def replace_all_selections(
         second element is the text that will be placed into the region.
     """
     offset: int = 0
+    previous_begin: int = -1
 
-    for old_region, new_data in sorted(replacement_data, key=lambda t: t[0].begin()):
-        new_region: sublime.Region = old_region
+    # NOTE: Replacement data usually comes from the view selections, which are already ordered.
+    # Only sort it if it isn't.
+    for old_region, _ in replacement_data:
+        begin: int = old_region.begin()
 
-        if offset:
-            new_region = sublime.Region(
-                old_region.begin() + offset, old_region.end() + offset
-            )
+        if begin < previous_begin:
+            replacement_data = sorted(replacement_data, key=_get_replacement_begin)
+            break
+
+        previous_begin = begin
 
-        offset += len(new_data) - old_region.size()
+    for old_region, new_data in replacement_data:
+        begin = old_region.begin()
+        end = old_region.end()
+
+        view.replace(
+            edit,
+            sublime.Region(begin + offset, end + offset) if offset else old_region,
+            new_data,
+        )
 
-        view.replace(edit, new_region, new_data)
+        offset += len(new_data) - (end - begin)
 
 
 def get_executable_from_settings(
@@ -239,7 +323,14 @@ def get_executable_from_settings(
         exec_list = [exec_list]
 
     for exec in exec_list:
-        if exec and (cmd_utils.can_exec(exec) or cmd_utils.which(exec)):
+        if not exec:
+            continue
+
+        if exec in _found_executables:
+            return exec
+
+        if cmd_utils.can_exec(exec) or cmd_utils.which(exec):
+            _found_executables.add(exec)
             return exec
 
     return None
@@ -272,6 +363,9 @@ def substitute_variables(
     Borrowed from SublimeLinter.
     """
     if isinstance(value, str):
+        if not _substitution_triggers_regex.search(value):
+            return value
+
         # Workaround https://github.com/SublimeTextIssues/Core/issues/1878
         # (E.g. UNC paths on Windows start with double backslashes.)
         value = value.replace(r"\\", r"\\\\")
@@ -327,7 +421,9 @@ def guess_project_root_of_view(view: sublime.View | None) -> str | None:
 
     for folder in folders:
         # Take the first one; should we take the deepest one? The shortest?
-        if os.path.commonprefix([folder, filename]) == folder:
+        # NOTE: Compare against the folder path with a trailing separator so that a folder
+        # doesn't match files inside sibling folders whose names start with its name.
+        if filename.startswith(os.path.join(folder, "")):
             return folder
 
     return None
@@ -404,6 +500,26 @@ def _extract_window_variables(window: sublime.Window) -> dict:
     return variables
 
 
+@lru_cache(maxsize=512)
+def _get_filename_parts(filename: str) -> tuple[str, str, str, str]:
+    """Get filename parts.
+
+    Parameters
+    ----------
+    filename : str
+        A file path.
+
+    Returns
+    -------
+    tuple[str, str, str, str]
+        The directory, the name, the name without extension and the extension of the file.
+    """
+    file_path, file_name = os.path.split(filename)
+    file_base_name, file_extension = os.path.splitext(file_name)
+
+    return file_path, file_name, file_base_name, file_extension
+
+
 def get_view_context(
     view: sublime.View | None, additional_context: dict | None = None
 ) -> ChainMap:
@@ -445,12 +561,11 @@ def get_view_context(
     filename: str = get_file_path(view)
 
     if filename:
-        basename: str = os.path.basename(filename)
-        file_base_name, file_extension = os.path.splitext(basename)
+        file_path, file_name, file_base_name, file_extension = _get_filename_parts(filename)
 
         context["file"] = filename
-        context["file_path"] = os.path.dirname(filename)
-        context["file_name"] = basename
+        context["file_path"] = file_path
+        context["file_name"] = file_name
         context["file_base_name"] = file_base_name
         context["file_extension"] = file_extension
 
@@ -470,12 +585,12 @@ def reload_plugins(prefix: str) -> None:
     prefix : str
         Python module prefix.
     """
-    toplevel: list[str] = []
-    for name, module in sys.modules.items():
-        if name.startswith(prefix):
-            depth: int = len(name.split("."))
-            if depth == 2:
-                toplevel.append(name)
+    _found_executables.clear()
+
+    # NOTE: Top level modules are the ones with exactly one dot in their names.
+    toplevel: list[str] = [
+        name for name in sys.modules if name.startswith(prefix) and name.count(".") == 1
+    ]
 
     for name in sorted(toplevel):
         sublime_plugin.reload_plugin(name)
@@ -523,24 +638,22 @@ def generate_keybindings_help_data(
     desired_commands_set: set[str] = set(
         [d["command"] for d in help_data_commands.values()]
     )
-    filtered_keybindings: list[dict[str, Any]] = [
-        kb
-        for kb in res
-        if all(("command" in kb, "keys" in kb, kb["command"] in desired_commands_set))
-    ]
+    # NOTE: Keybindings of the desired commands grouped by command.
+    keybindings_by_command: dict[str, list[dict[str, Any]]] = {}
+
+    for kb in res:
+        if "command" in kb and "keys" in kb and kb["command"] in desired_commands_set:
+            keybindings_by_command.setdefault(kb["command"], []).append(kb)
+
     joined_keys: list[str] = []
     help_data_keys: dict[str, list[str]] = {}
 
     for help_text, cmd_data in help_data_commands.items():
-        for kb in filtered_keybindings:
+        cmd_args: Any = cmd_data.get("args", None)
+
+        for kb in keybindings_by_command.get(cmd_data["command"], ()):
             keys_list: list[str] = kb["keys"]
-            if all(
-                (
-                    cmd_data.get("args", None) == kb.get("args", None),
-                    cmd_data["command"] == kb.get("command", None),
-                    keys_list,
-                )
-            ):
+            if keys_list and cmd_args == kb.get("args", None):
                 keys_str: str = ", ".join(keys_list)
                 joined_keys.append(keys_str)
 
@@ -549,8 +662,8 @@ def generate_keybindings_help_data(
                 else:
                     help_data_keys[help_text] = [keys_str]
 
-    help_markup: str = ""
-    justification: int = len(max(joined_keys, key=len)) + 2
+    help_markup_rows: list[str] = []
+    justification: int = max(map(len, joined_keys), default=0) + 2
 
     for help_text, keys in help_data_keys.items():
         keys.sort()
@@ -558,17 +671,20 @@ def generate_keybindings_help_data(
         rest_of_keys: list[str] = keys[:-1]
 
         for key in rest_of_keys:
-            help_markup += help_data_markup.format(key=key, description="") + "\n"
+            help_markup_rows.append(help_data_markup.format(key=key, description=""))
 
-        help_markup += (
+        # NOTE: Pad with the spacer directly instead of padding with a placeholder character
+        # that is then replaced. The replacement also affected placeholder characters that were
+        # part of the keys themselves.
+        help_markup_rows.append(
             help_data_markup.format(
-                key=last_key.ljust(justification, "|").replace("|", spacer),
+                key=last_key + spacer * (justification - len(last_key)),
                 description=help_text,
             )
-            + "\n"
         )
 
-    return help_markup
+    # NOTE: Every row, including the last one, ends with a new line.
+    return "\n".join(help_markup_rows) + "\n" if help_markup_rows else ""
 
 
 if __name__ == "__main__":
@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
 """Module to download files. It displays a progress bar of the download progress.
 """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from email.message import Message
+
 # NOTE: Web developers can go f*ck themselves!!!
 import ssl
 
@@ -40,7 +47,7 @@ class TqdmUpTo(tqdm):
         self.update(b * bsize - self.n)  # will also set self.n = b * bsize
 
 
-def download(url: str, filename: str) -> None:
+def download(url: str, filename: str) -> Message:
     """Download file.
 
     Parameters
@@ -49,11 +56,18 @@ def download(url: str, filename: str) -> None:
         The URL to the file to download.
     filename : str
         Downloaded file destination.
+
+    Returns
+    -------
+    Message
+        The response headers.
     """
     with TqdmUpTo(unit="B", unit_scale=True, unit_divisor=1024, miniters=1) as t:
-        urlretrieve(url, filename=filename, reporthook=t.update_to, data=None)
+        _, headers = urlretrieve(url, filename=filename, reporthook=t.update_to, data=None)
         t.total = t.n
 
+    return headers
+
 
 if __name__ == "__main__":
     pass